@@ -13,14 +13,96 @@ Exit codes:
   3 - Ticket not found or invalid structure
 """
 import argparse
+import bisect
+import hashlib
 import json
+import os
 import re
 import sys
 from dataclasses import dataclass, field
+from functools import cached_property, partial
 from pathlib import Path
 
-
-@dataclass
+try:
+    import orjson
+except ImportError:  # Optional: faster --format json output
+    orjson = None
+
+
+def dumps_json(data) -> str:
+    """Serialize validation results (plain dicts) as JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+# Ambiguity markers checked line-by-line in 2-plan.md
+_AMBIGUITY_PATTERNS = [
+    (re.compile(r"\bTBD\b", re.IGNORECASE), "TBD marker found"),
+    (re.compile(r"\bTODO\b", re.IGNORECASE), "TODO marker found"),
+    (re.compile(r"\b\?\?\?\b", re.IGNORECASE), "??? placeholder found"),
+    (re.compile(r"\[TBD\]", re.IGNORECASE), "[TBD] placeholder found"),
+    (re.compile(r"\{TBD\}", re.IGNORECASE), "{TBD} placeholder found"),
+]
+# Fused alternation: one search per line rejects lines with no marker at all
+_AMBIGUITY_RE = re.compile(
+    "|".join(p.pattern for p, _ in _AMBIGUITY_PATTERNS), re.IGNORECASE
+)
+_SPEC_MARKER_RE = re.compile(r"\bTBD\b|\bTODO\b", re.IGNORECASE)
+_NEWLINE_RE = re.compile(r"\n")
+
+# Hashed into every --cache key; bump when a validation check changes
+_CACHE_VERSION = 1
+
+_QUESTION_RE = re.compile(r"^\d+\.\s+(.+)$", re.MULTILINE)
+_RESOLVED_RE = re.compile(r"RESOLVED", re.IGNORECASE)
+_DEPS_RE = re.compile(r"Dependencies:\s*(.+?)(?:\n|$)")
+
+# Table / list detection
+_TABLE_RE = re.compile(r"\|.*\|.*\|")
+_TABLE_4COL_RE = re.compile(r"\|.*\|.*\|.*\|")
+_UNIT_COLUMNS_RE = re.compile(
+    r"\|\s*Test\s*\|.*\|\s*Input\s*\|.*\|\s*Expected\s*\|", re.IGNORECASE
+)
+_BULLET_RE = re.compile(r"^\s*[-*]\s+", re.MULTILINE)
+
+# Prerequisite content probes
+_ENV_NONE_RE = re.compile(r"```\s*\n\s*```|None required|N/A")
+_ENV_DEFINED_RE = re.compile(r"export\s+\w+|```bash")
+_DB_RE = re.compile(r"database|db|state setup", re.IGNORECASE)
+_DB_SETUP_RE = re.compile(r"```|command|script", re.IGNORECASE)
+
+# Integration test steps
+_INT_STEPS = ("Setup", "Action", "Verify")
+_INT_STEP_RE = re.compile(r"\b(Setup|Action|Verify)\b", re.IGNORECASE)
+
+# E2E procedure subsections
+_E2E_REQUIRED_SUBS = ("Setup", "Execution", "Verification")
+_E2E_SUB_RE = re.compile(
+    r"^#{3,4} (Setup|Execution|Verification|Teardown)\b", re.MULTILINE
+)
+
+# Manual inspection indicators in E2E procedures
+_MANUAL_INDICATORS = {
+    "screenshot": "screenshot verification",
+    "visual": "visual inspection",
+    "manual": "manual check",
+    "inspect": "inspection step",
+    "observe": "observation step",
+}
+_MANUAL_RE = re.compile("|".join(_MANUAL_INDICATORS), re.IGNORECASE)
+_CAPTURE_RE = re.compile(r"save|capture|record|document", re.IGNORECASE)
+
+
+# Roadmap marker per validation status; unresolved questions override "issues"
+_ROADMAP_MARKERS = {
+    "valid": "[+ ready]",
+    "blocked": "[x missing]",
+    "issues": "[x missing]",
+}
+
+
+@dataclass(slots=True)
 class ValidationIssue:
     severity: str  # "error", "warning", "info"
     category: str  # "ambiguity", "prerequisites", "testing"
@@ -29,29 +111,62 @@ class ValidationIssue:
     line: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     ticket_id: str
     status: str  # "valid", "issues", "blocked", "not_found"
     issues: list[ValidationIssue] = field(default_factory=list)
     checks_passed: list[str] = field(default_factory=list)
     checks_failed: list[str] = field(default_factory=list)
+    # Tallies maintained by add_issue so summaries never rescan issues
+    error_count: int = field(default=0, init=False, repr=False)
+    warning_count: int = field(default=0, init=False, repr=False)
+    has_question_issue: bool = field(default=False, init=False, repr=False)
+    has_blocking_error: bool = field(default=False, init=False, repr=False)
+    # Error messages so far; copied to checks_failed once validation completes
+    error_messages: list[str] = field(default_factory=list, init=False, repr=False)
+    # JSON form of each issue, built as issues are added
+    issue_dicts: list[dict] = field(default_factory=list, init=False, repr=False)
+
+    def add_issue(self, issue: ValidationIssue) -> None:
+        """Record an issue and update the running tallies."""
+        self.issues.append(issue)
+        self.issue_dicts.append({
+            "severity": issue.severity,
+            "category": issue.category,
+            "message": issue.message,
+            "file": issue.file,
+            "line": issue.line,
+        })
+        msg_lower = issue.message.lower()
+        if "question" in msg_lower or "unresolved" in msg_lower:
+            self.has_question_issue = True
+        if issue.severity == "error":
+            self.error_count += 1
+            self.error_messages.append(issue.message)
+            # Missing critical prerequisites block implementation
+            if "missing" in msg_lower and issue.category == "prerequisites":
+                self.has_blocking_error = True
+        elif issue.severity == "warning":
+            self.warning_count += 1
 
     @property
     def roadmap_marker(self) -> str:
         """Return suggested roadmap marker based on validation status."""
-        if self.status == "valid":
-            return "[+ ready]"
-        elif self.status == "blocked":
-            return "[x missing]"
-        else:  # "issues" - has warnings or non-blocking errors
-            has_questions = any(
-                "question" in i.message.lower() or "unresolved" in i.message.lower()
-                for i in self.issues
-            )
-            if has_questions:
-                return "[? questions]"
-            return "[x missing]"
+        # "issues" - has warnings or non-blocking errors
+        if self.status == "issues" and self.has_question_issue:
+            return "[? questions]"
+        return _ROADMAP_MARKERS.get(self.status, "[x missing]")
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ValidationResult":
+        """Rebuild a result from its to_dict() form."""
+        result = cls(ticket_id=data["ticket_id"], status=data["status"])
+        result.checks_passed = list(data["checks_passed"])
+        for i in data["issues"]:
+            result.add_issue(ValidationIssue(**i))
+        result.checks_failed = list(data["checks_failed"])
+        return result
 
     def to_dict(self) -> dict:
         return {
@@ -59,69 +174,229 @@ class ValidationResult:
             "status": self.status,
             "roadmap_marker": self.roadmap_marker,
             "summary": {
-                "errors": len([i for i in self.issues if i.severity == "error"]),
-                "warnings": len([i for i in self.issues if i.severity == "warning"]),
+                "errors": self.error_count,
+                "warnings": self.warning_count,
                 "passed": len(self.checks_passed),
                 "failed": len(self.checks_failed),
             },
             "checks_passed": self.checks_passed,
             "checks_failed": self.checks_failed,
-            "issues": [
-                {
-                    "severity": i.severity,
-                    "category": i.category,
-                    "message": i.message,
-                    "file": i.file,
-                    "line": i.line,
-                }
-                for i in self.issues
-            ],
+            "issues": self.issue_dicts,
         }
 
 
-def find_docs_path(start_path: Path) -> Path | None:
-    """Find .pmc/docs directory."""
-    current = start_path.resolve()
-    while current != current.parent:
-        docs_path = current / ".pmc" / "docs"
-        if docs_path.exists():
-            return docs_path
-        current = current.parent
-    return None
+@dataclass
+class TicketDocs:
+    """Planning documents of a ticket, read once and shared by all checks.
+
+    Missing documents are ``None``. The spec's headers are indexed once,
+    lazily, and every section lookup is sliced from that index.
+    """
+    definition: str | None = None
+    plan: str | None = None
+    spec: str | None = None
+
+    @classmethod
+    def load(cls, ticket_path: Path, entries: set[str]) -> "TicketDocs":
+        """Read the documents listed in entries (the ticket directory's names)."""
+        def read(name: str) -> str | None:
+            return _read_text(ticket_path / name) if name in entries else None
+
+        return cls(
+            definition=read("1-definition.md"),
+            plan=read("2-plan.md"),
+            spec=read("3-spec.md"),
+        )
+
+    @cached_property
+    def spec_sections(self) -> dict[str, tuple[int, int, int]]:
+        return parse_sections(self.spec) if self.spec is not None else {}
 
+    def _spec_span(self, title: str, nested: bool) -> str | None:
+        span = self.spec_sections.get(title)
+        if span is None:
+            return None
+        start, subsection_end, section_end = span
+        return self.spec[start:subsection_end if nested else section_end]
+
+    @property
+    def open_questions(self) -> str | None:
+        return self._spec_span("open questions", nested=False)
+
+    @property
+    def env_setup(self) -> str | None:
+        return self._spec_span("test environment setup", nested=False)
+
+    @property
+    def mock_data(self) -> str | None:
+        return self._spec_span("mock data", nested=False)
+
+    @property
+    def unit_tests(self) -> str | None:
+        return self._spec_span("unit tests", nested=True)
+
+    @property
+    def integration_tests(self) -> str | None:
+        return self._spec_span("integration tests", nested=True)
+
+    @property
+    def e2e_procedure(self) -> str | None:
+        return self._spec_span("e2e test procedure", nested=False)
 
-def check_ambiguity(ticket_path: Path, result: ValidationResult) -> None:
+    @property
+    def edge_cases(self) -> str | None:
+        return self._spec_span("edge cases", nested=False)
+
+
+def iter_headers(content: str):
+    """Yield (level, title, line_start, line_end) for lines starting with "##".
+
+    Header lines are located with str.find rather than a regex, so the scan
+    only inspects lines that start with "##". The title may be empty.
+    """
+    if content.startswith("##"):
+        start = 0
+    else:
+        pos = content.find("\n##")
+        start = pos + 1 if pos != -1 else -1
+    while start != -1:
+        end = content.find("\n", start)
+        if end == -1:
+            end = len(content)
+        line = content[start:end]
+        title = line.lstrip("#")
+        yield len(line) - len(title), title.strip(), start, end
+        pos = content.find("\n##", end)
+        start = pos + 1 if pos != -1 else -1
+
+
+def parse_sections(content: str) -> dict[str, tuple[int, int, int]]:
+    """Index markdown sections by lowercased header title in one pass.
+
+    Each title maps to ``(body_start, subsection_end, section_end)``. The
+    body starts on the line after the header. A section runs to the next
+    ``## `` header, so it includes its ``###`` subsections. A subsection
+    (e.g. Unit Tests) runs to the next header of any level. The first
+    occurrence of a title wins, and both ends come from that occurrence.
+    """
+    sections: dict[str, tuple[int, int, int]] = {}
+    # Walk backwards so the next boundaries are known at each header
+    subsection_end = section_end = len(content)
+    for level, title, line_start, line_end in reversed(list(iter_headers(content))):
+        if title and line_end < len(content):
+            sections[title.lower()] = (line_end + 1, subsection_end, section_end)
+        subsection_end = line_start - 1
+        # Only "## " followed by a non-"#" character ends a top-level section
+        after = content[line_start + 3:line_start + 4]
+        if level == 2 and content.startswith(" ", line_start + 2) and after not in ("", "#"):
+            section_end = line_start - 1
+    return sections
+
+
+def _read_text(path: Path) -> str:
+    """Read a UTF-8 file with the newline translation read_text applies."""
+    text = path.read_bytes().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _list_dir(path: Path) -> set[str] | None:
+    """Return the entry names of a directory, or None if it does not exist."""
+    try:
+        with os.scandir(path) as it:
+            return {e.name for e in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def file_contains(path: Path, needle: str, chunk_size: int = 65536) -> bool:
+    """Return True if the file contains needle, stopping at the first hit.
+
+    The file is scanned in chunks; the last len(needle) - 1 bytes of each
+    chunk are carried over so matches spanning a boundary are found.
+    """
+    needle_bytes = needle.encode("utf-8")
+    keep = len(needle_bytes) - 1
+    tail = b""
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            if needle_bytes in tail + chunk:
+                return True
+            tail = (tail + chunk)[-keep:] if keep else b""
+    return False
+
+
+def find_docs_path(start_path: Path) -> Path | None:
+    """Find .pmc/docs directory."""
+    current = os.path.realpath(start_path)
+    while True:
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        candidate = os.path.join(current, ".pmc", "docs")
+        if os.path.isdir(candidate):
+            return Path(candidate)
+        current = parent
+
+
+def find_marker_lines(content: str, pattern: re.Pattern) -> list[tuple[int, str]]:
+    """Return (line number, line) for each line containing a pattern match.
+
+    Scans the whole document once instead of splitting it into lines and
+    searching each one; line numbers are recovered from match offsets.
+    """
+    hits = []
+    newlines = None
+    last_start = -1
+    for m in pattern.finditer(content):
+        start = content.rfind("\n", 0, m.start()) + 1
+        if start == last_start:
+            continue  # Line already reported
+        last_start = start
+        if newlines is None:
+            newlines = [n.start() for n in _NEWLINE_RE.finditer(content)]
+        end = content.find("\n", m.end())
+        line = content[start:end if end != -1 else len(content)]
+        hits.append((bisect.bisect_right(newlines, m.start()) + 1, line))
+    return hits
+
+
+def line_snippet(line: str, width: int = 60) -> str:
+    """Return the stripped line cut to width, for issue messages."""
+    return line.strip()[:width]
+
+
+def check_ambiguity(docs: TicketDocs, result: ValidationResult) -> None:
     """Check for unresolved ambiguity in planning docs."""
 
     # Check 2-plan.md for TBD/TODO
-    plan_file = ticket_path / "2-plan.md"
-    if plan_file.exists():
-        content = plan_file.read_text(encoding="utf-8")
-        lines = content.split("\n")
+    if docs.plan is not None:
+        content = docs.plan
 
         # Check for TBD/TODO markers
-        ambiguity_patterns = [
-            (r"\bTBD\b", "TBD marker found"),
-            (r"\bTODO\b", "TODO marker found"),
-            (r"\b\?\?\?\b", "??? placeholder found"),
-            (r"\[TBD\]", "[TBD] placeholder found"),
-            (r"\{TBD\}", "{TBD} placeholder found"),
-        ]
+        # Every marker contains one of these literals; skip the regex otherwise
+        low = content.lower()
+        if "tbd" in low or "todo" in low or "???" in low:
+            marker_lines = find_marker_lines(content, _AMBIGUITY_RE)
+        else:
+            marker_lines = []
 
-        for i, line in enumerate(lines, 1):
-            for pattern, msg in ambiguity_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    result.issues.append(ValidationIssue(
+        for i, line in marker_lines:
+            snippet = line_snippet(line)
+            for pattern, msg in _AMBIGUITY_PATTERNS:
+                if pattern.search(line):
+                    result.add_issue(ValidationIssue(
                         severity="error",
                         category="ambiguity",
-                        message=f"{msg}: {line.strip()[:60]}",
+                        message=f"{msg}: {snippet}",
                         file="2-plan.md",
                         line=i,
                     ))
 
         # Check Technical Decisions table
         if "Technical Decisions" not in content:
-            result.issues.append(ValidationIssue(
+            result.add_issue(ValidationIssue(
                 severity="warning",
                 category="ambiguity",
                 message="No Technical Decisions section found",
@@ -131,54 +406,51 @@ def check_ambiguity(ticket_path: Path, result: ValidationResult) -> None:
             result.checks_passed.append("Technical Decisions section exists")
 
     # Check 3-spec.md for Open Questions
-    spec_file = ticket_path / "3-spec.md"
-    if spec_file.exists():
-        content = spec_file.read_text(encoding="utf-8")
+    if docs.spec is not None:
+        content = docs.spec
 
         # Check Open Questions section
-        open_q_match = re.search(
-            r"##\s*Open Questions\s*\n(.*?)(?=\n## [^#]|\Z)",
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
-
-        if open_q_match:
-            section = open_q_match.group(1).strip()
+        if docs.open_questions is not None:
+            section = docs.open_questions.strip()
             # Check if there are unresolved questions (numbered items without RESOLVED)
-            questions = re.findall(r"^\d+\.\s+(.+)$", section, re.MULTILINE)
-            unresolved = [q for q in questions if "RESOLVED" not in q.upper()]
-
-            if unresolved:
-                for q in unresolved:
-                    result.issues.append(ValidationIssue(
+            total = 0
+            unresolved = False
+            for m in _QUESTION_RE.finditer(section):
+                total += 1
+                question = m.group(1)
+                if not _RESOLVED_RE.search(question):
+                    unresolved = True
+                    result.add_issue(ValidationIssue(
                         severity="error",
                         category="ambiguity",
-                        message=f"Unresolved question: {q[:60]}",
+                        message=f"Unresolved question: {question[:60]}",
                         file="3-spec.md",
                     ))
-            elif questions:
-                result.checks_passed.append(f"All {len(questions)} open questions resolved")
-            else:
-                result.checks_passed.append("No open questions")
+
+            if not unresolved:
+                if total:
+                    result.checks_passed.append(f"All {total} open questions resolved")
+                else:
+                    result.checks_passed.append("No open questions")
 
         # Check for TBD in spec
-        for i, line in enumerate(content.split("\n"), 1):
-            if re.search(r"\bTBD\b|\bTODO\b", line, re.IGNORECASE):
-                result.issues.append(ValidationIssue(
+        low = content.lower()
+        if "tbd" in low or "todo" in low:
+            for i, line in find_marker_lines(content, _SPEC_MARKER_RE):
+                result.add_issue(ValidationIssue(
                     severity="error",
                     category="ambiguity",
-                    message=f"Unresolved marker: {line.strip()[:60]}",
+                    message=f"Unresolved marker: {line_snippet(line)}",
                     file="3-spec.md",
                     line=i,
                 ))
 
 
-def check_prerequisites(ticket_path: Path, result: ValidationResult) -> None:
+def check_prerequisites(docs: TicketDocs, result: ValidationResult) -> None:
     """Check that prerequisites are documented and actionable."""
 
-    spec_file = ticket_path / "3-spec.md"
-    if not spec_file.exists():
-        result.issues.append(ValidationIssue(
+    if docs.spec is None:
+        result.add_issue(ValidationIssue(
             severity="error",
             category="prerequisites",
             message="3-spec.md not found - cannot verify prerequisites",
@@ -186,30 +458,22 @@ def check_prerequisites(ticket_path: Path, result: ValidationResult) -> None:
         ))
         return
 
-    content = spec_file.read_text(encoding="utf-8")
-
     # Check Test Environment Setup section
-    env_match = re.search(
-        r"##\s*Test Environment Setup\s*\n(.*?)(?=\n## [^#]|\Z)",
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
-
-    if not env_match:
-        result.issues.append(ValidationIssue(
+    if docs.env_setup is None:
+        result.add_issue(ValidationIssue(
             severity="error",
             category="prerequisites",
             message="Missing 'Test Environment Setup' section",
             file="3-spec.md",
         ))
     else:
-        section = env_match.group(1)
+        section = docs.env_setup
 
         # Check for Prerequisites subsection
         if "### Prerequisites" in section or "#### Prerequisites" in section:
             result.checks_passed.append("Prerequisites subsection exists")
         else:
-            result.issues.append(ValidationIssue(
+            result.add_issue(ValidationIssue(
                 severity="warning",
                 category="prerequisites",
                 message="No Prerequisites subsection in Test Environment Setup",
@@ -219,12 +483,12 @@ def check_prerequisites(ticket_path: Path, result: ValidationResult) -> None:
         # Check for Environment Variables
         if "Environment Variables" in section:
             # Check if there are actual variables defined
-            if re.search(r"```\s*\n\s*```|None required|N/A", section):
+            if _ENV_NONE_RE.search(section):
                 result.checks_passed.append("Environment variables documented (none needed)")
-            elif re.search(r"export\s+\w+|```bash", section):
+            elif _ENV_DEFINED_RE.search(section):
                 result.checks_passed.append("Environment variables documented")
             else:
-                result.issues.append(ValidationIssue(
+                result.add_issue(ValidationIssue(
                     severity="warning",
                     category="prerequisites",
                     message="Environment Variables section exists but unclear",
@@ -232,11 +496,11 @@ def check_prerequisites(ticket_path: Path, result: ValidationResult) -> None:
                 ))
 
         # Check for Database/State Setup if mentioned
-        if re.search(r"database|db|state setup", section, re.IGNORECASE):
-            if re.search(r"```|command|script", section, re.IGNORECASE):
+        if _DB_RE.search(section):
+            if _DB_SETUP_RE.search(section):
                 result.checks_passed.append("Database/State setup documented")
             else:
-                result.issues.append(ValidationIssue(
+                result.add_issue(ValidationIssue(
                     severity="warning",
                     category="prerequisites",
                     message="Database/State mentioned but setup commands unclear",
@@ -244,20 +508,14 @@ def check_prerequisites(ticket_path: Path, result: ValidationResult) -> None:
                 ))
 
     # Check Mock Data section
-    mock_match = re.search(
-        r"##\s*Mock Data\s*\n(.*?)(?=\n## [^#]|\Z)",
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
-
-    if mock_match:
-        section = mock_match.group(1)
-        if re.search(r"\|.*\|.*\|", section):  # Has table
+    if docs.mock_data is not None:
+        section = docs.mock_data
+        if _TABLE_RE.search(section):  # Has table
             result.checks_passed.append("Mock data documented with table")
         elif "None" in section or "N/A" in section:
             result.checks_passed.append("Mock data documented (none needed)")
         else:
-            result.issues.append(ValidationIssue(
+            result.add_issue(ValidationIssue(
                 severity="warning",
                 category="prerequisites",
                 message="Mock Data section unclear - use table format",
@@ -265,11 +523,10 @@ def check_prerequisites(ticket_path: Path, result: ValidationResult) -> None:
             ))
 
     # Check 1-definition.md for Dependencies
-    def_file = ticket_path / "1-definition.md"
-    if def_file.exists():
-        def_content = def_file.read_text(encoding="utf-8")
+    if docs.definition is not None:
+        def_content = docs.definition
         if "Dependencies:" in def_content:
-            deps_match = re.search(r"Dependencies:\s*(.+?)(?:\n|$)", def_content)
+            deps_match = _DEPS_RE.search(def_content)
             if deps_match:
                 deps = deps_match.group(1).strip()
                 if deps and deps.lower() not in ["none", "n/a", "-"]:
@@ -278,31 +535,22 @@ def check_prerequisites(ticket_path: Path, result: ValidationResult) -> None:
                     result.checks_passed.append("Dependencies documented (none)")
 
 
-def check_testing_methods(ticket_path: Path, result: ValidationResult) -> None:
+def check_testing_methods(docs: TicketDocs, result: ValidationResult) -> None:
     """Check that testing methods are clearly identified."""
 
-    spec_file = ticket_path / "3-spec.md"
-    if not spec_file.exists():
+    if docs.spec is None:
         return
 
-    content = spec_file.read_text(encoding="utf-8")
-
     # Check Unit Tests section
-    unit_match = re.search(
-        r"###?\s*Unit Tests\s*\n(.*?)(?=\n###?|\n##|\Z)",
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
-
-    if unit_match:
-        section = unit_match.group(1)
+    if docs.unit_tests is not None:
+        section = docs.unit_tests
         # Check for table with Input/Expected columns
-        if re.search(r"\|\s*Test\s*\|.*\|\s*Input\s*\|.*\|\s*Expected\s*\|", section, re.IGNORECASE):
+        if _UNIT_COLUMNS_RE.search(section):
             result.checks_passed.append("Unit tests have Input/Expected columns")
-        elif re.search(r"\|.*\|.*\|.*\|", section):
+        elif _TABLE_4COL_RE.search(section):
             result.checks_passed.append("Unit tests documented in table")
         else:
-            result.issues.append(ValidationIssue(
+            result.add_issue(ValidationIssue(
                 severity="warning",
                 category="testing",
                 message="Unit tests should use table format with Input/Expected",
@@ -310,27 +558,16 @@ def check_testing_methods(ticket_path: Path, result: ValidationResult) -> None:
             ))
 
     # Check Integration Tests section
-    int_match = re.search(
-        r"###?\s*Integration Tests\s*\n(.*?)(?=\n###?|\n##|\Z)",
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
-
-    if int_match:
-        section = int_match.group(1)
+    if docs.integration_tests is not None:
+        section = docs.integration_tests
         # Check for Setup/Action/Verify pattern
-        has_setup = bool(re.search(r"\bSetup\b", section, re.IGNORECASE))
-        has_action = bool(re.search(r"\bAction\b", section, re.IGNORECASE))
-        has_verify = bool(re.search(r"\bVerify\b", section, re.IGNORECASE))
+        present = {m.group(0).lower() for m in _INT_STEP_RE.finditer(section)}
+        missing = [step for step in _INT_STEPS if step.lower() not in present]
 
-        if has_setup and has_action and has_verify:
+        if not missing:
             result.checks_passed.append("Integration tests have Setup/Action/Verify")
         else:
-            missing = []
-            if not has_setup: missing.append("Setup")
-            if not has_action: missing.append("Action")
-            if not has_verify: missing.append("Verify")
-            result.issues.append(ValidationIssue(
+            result.add_issue(ValidationIssue(
                 severity="warning",
                 category="testing",
                 message=f"Integration tests missing: {', '.join(missing)}",
@@ -338,29 +575,23 @@ def check_testing_methods(ticket_path: Path, result: ValidationResult) -> None:
             ))
 
     # Check E2E Test Procedure section - CRITICAL
-    e2e_match = re.search(
-        r"##\s*E2E Test Procedure\s*\n(.*?)(?=\n## [^#]|\Z)",
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
-
-    if not e2e_match:
-        result.issues.append(ValidationIssue(
+    if docs.e2e_procedure is None:
+        result.add_issue(ValidationIssue(
             severity="error",
             category="testing",
             message="Missing 'E2E Test Procedure' section",
             file="3-spec.md",
         ))
     else:
-        section = e2e_match.group(1)
+        section = docs.e2e_procedure
 
         # Check for required subsections
-        required_subs = ["Setup", "Execution", "Verification"]
-        for sub in required_subs:
-            if f"### {sub}" in section or f"#### {sub}" in section:
+        found_subs = {m.group(1) for m in _E2E_SUB_RE.finditer(section)}
+        for sub in _E2E_REQUIRED_SUBS:
+            if sub in found_subs:
                 result.checks_passed.append(f"E2E has {sub} subsection")
             else:
-                result.issues.append(ValidationIssue(
+                result.add_issue(ValidationIssue(
                     severity="error",
                     category="testing",
                     message=f"E2E Test Procedure missing '{sub}' subsection",
@@ -368,23 +599,20 @@ def check_testing_methods(ticket_path: Path, result: ValidationResult) -> None:
                 ))
 
         # Check for Teardown (optional but recommended)
-        if "Teardown" in section:
+        if "Teardown" in found_subs:
             result.checks_passed.append("E2E has Teardown subsection")
 
         # Check Verification has specific checks
-        verify_match = re.search(
-            r"###?\s*Verification\s*\n(.*?)(?=\n###?|\n##|\Z)",
-            section,
-            re.DOTALL | re.IGNORECASE
-        )
-        if verify_match:
-            verify_section = verify_match.group(1)
-            if re.search(r"\|.*\|.*\|", verify_section):  # Has table
+        # Looked up within this E2E section only, ending at the next header
+        verify_span = parse_sections(section).get("verification")
+        if verify_span is not None:
+            verify_section = section[verify_span[0]:verify_span[1]]
+            if _TABLE_RE.search(verify_section):  # Has table
                 result.checks_passed.append("E2E Verification has checklist table")
-            elif re.search(r"^\s*[-*]\s+", verify_section, re.MULTILINE):  # Has bullets
+            elif _BULLET_RE.search(verify_section):  # Has bullets
                 result.checks_passed.append("E2E Verification has checklist")
             else:
-                result.issues.append(ValidationIssue(
+                result.add_issue(ValidationIssue(
                     severity="warning",
                     category="testing",
                     message="E2E Verification should have specific checks (table or list)",
@@ -392,25 +620,17 @@ def check_testing_methods(ticket_path: Path, result: ValidationResult) -> None:
                 ))
 
         # Check for manual inspection indicators
-        manual_patterns = [
-            (r"screenshot", "screenshot verification"),
-            (r"visual", "visual inspection"),
-            (r"manual", "manual check"),
-            (r"inspect", "inspection step"),
-            (r"observe", "observation step"),
+        found = {m.group(0).lower() for m in _MANUAL_RE.finditer(section)}
+        manual_found = [
+            desc for word, desc in _MANUAL_INDICATORS.items() if word in found
         ]
 
-        manual_found = []
-        for pattern, desc in manual_patterns:
-            if re.search(pattern, section, re.IGNORECASE):
-                manual_found.append(desc)
-
         if manual_found:
             # Check if manual steps have clear instructions
-            if re.search(r"save|capture|record|document", section, re.IGNORECASE):
+            if _CAPTURE_RE.search(section):
                 result.checks_passed.append(f"Manual verification documented: {', '.join(manual_found[:2])}")
             else:
-                result.issues.append(ValidationIssue(
+                result.add_issue(ValidationIssue(
                     severity="warning",
                     category="testing",
                     message=f"Manual steps ({', '.join(manual_found[:2])}) need clear capture/save instructions",
@@ -418,25 +638,19 @@ def check_testing_methods(ticket_path: Path, result: ValidationResult) -> None:
                 ))
 
     # Check Edge Cases section
-    edge_match = re.search(
-        r"##\s*Edge Cases\s*\n(.*?)(?=\n## [^#]|\Z)",
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
-
-    if edge_match:
-        section = edge_match.group(1)
-        if re.search(r"\|.*\|.*\|.*\|", section):  # Has table
+    if docs.edge_cases is not None:
+        section = docs.edge_cases
+        if _TABLE_4COL_RE.search(section):  # Has table
             result.checks_passed.append("Edge cases documented in table")
         else:
-            result.issues.append(ValidationIssue(
+            result.add_issue(ValidationIssue(
                 severity="warning",
                 category="testing",
                 message="Edge cases should use table format",
                 file="3-spec.md",
             ))
     else:
-        result.issues.append(ValidationIssue(
+        result.add_issue(ValidationIssue(
             severity="warning",
             category="testing",
             message="No Edge Cases section - consider adding",
@@ -444,28 +658,27 @@ def check_testing_methods(ticket_path: Path, result: ValidationResult) -> None:
         ))
 
 
-def check_repo_management(ticket_path: Path, docs_path: Path, result: ValidationResult) -> None:
+def check_repo_management(docs: TicketDocs, docs_path: Path, result: ValidationResult) -> None:
     """Check repo management documentation (git worktree/branch)."""
 
-    plan_file = ticket_path / "2-plan.md"
-    if not plan_file.exists():
+    if docs.plan is None:
         return
 
-    content = plan_file.read_text(encoding="utf-8")
+    content = docs.plan
 
     # Check if Files to Modify section exists
     if "Files to Modify" in content:
-        if re.search(r"\|.*\|.*\|", content):
+        if _TABLE_RE.search(content):
             result.checks_passed.append("Files to Modify documented")
         else:
-            result.issues.append(ValidationIssue(
+            result.add_issue(ValidationIssue(
                 severity="warning",
                 category="prerequisites",
                 message="Files to Modify should use table format",
                 file="2-plan.md",
             ))
     else:
-        result.issues.append(ValidationIssue(
+        result.add_issue(ValidationIssue(
             severity="warning",
             category="prerequisites",
             message="No 'Files to Modify' section in plan",
@@ -475,12 +688,11 @@ def check_repo_management(ticket_path: Path, docs_path: Path, result: Validation
     # Check roadmap for ticket entry
     roadmap_file = docs_path / "3-plan" / "roadmap.md"
     if roadmap_file.exists():
-        roadmap = roadmap_file.read_text(encoding="utf-8")
-        ticket_id = ticket_path.name
-        if ticket_id in roadmap:
+        ticket_id = result.ticket_id
+        if file_contains(roadmap_file, ticket_id):
             result.checks_passed.append(f"{ticket_id} found in roadmap.md")
         else:
-            result.issues.append(ValidationIssue(
+            result.add_issue(ValidationIssue(
                 severity="warning",
                 category="prerequisites",
                 message=f"{ticket_id} not found in roadmap.md",
@@ -488,32 +700,90 @@ def check_repo_management(ticket_path: Path, docs_path: Path, result: Validation
             ))
 
 
-def validate_ticket(ticket_id: str, docs_path: Path) -> ValidationResult:
-    """Validate a ticket's planning documents."""
+def _cache_key(ticket_path: Path, docs: TicketDocs, docs_path: Path) -> str:
+    """Fingerprint everything a validation result depends on."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{_CACHE_VERSION}\0{ticket_path}\0".encode("utf-8"))
+    for content in (docs.definition, docs.plan, docs.spec):
+        if content is None:
+            h.update(b"\1")
+        else:
+            h.update(b"\0" + content.encode("utf-8") + b"\0")
+    # The roadmap is only searched for the ticket ID; its stat is enough
+    try:
+        st = (docs_path / "3-plan" / "roadmap.md").stat()
+        h.update(f"{st.st_mtime_ns}:{st.st_size}".encode("utf-8"))
+    except FileNotFoundError:
+        h.update(b"\1")
+    return h.hexdigest()
+
+
+def _cache_file(docs_path: Path, ticket_id: str) -> Path:
+    # One file per ticket: batch workers never read-modify-write a shared file
+    return docs_path.parent / ".cache" / "plan-validation" / f"{ticket_id}.json"
+
+
+def _load_cache(cache_file: Path, key: str) -> ValidationResult | None:
+    try:
+        cached = json.loads(cache_file.read_bytes())
+        if cached.get("key") == key:
+            return ValidationResult.from_dict(cached["result"])
+    except (OSError, ValueError, AttributeError, KeyError, TypeError):
+        pass  # Missing or unreadable entries are recomputed
+    return None
+
+
+def _store_cache(cache_file: Path, key: str, result: ValidationResult) -> None:
+    # The pid suffix keeps two runs on the same ticket from sharing a tmp file
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(json.dumps({"key": key, "result": result.to_dict()}), encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def validate_ticket(ticket_id: str, docs_path: Path, use_cache: bool = False) -> ValidationResult:
+    """Validate a ticket's planning documents.
+
+    With use_cache, results are stored in .pmc/.cache/plan-validation/
+    and reused while the ticket's documents and roadmap.md are unchanged.
+    """
 
     result = ValidationResult(ticket_id=ticket_id, status="valid")
 
     # Find ticket directory
     ticket_path = docs_path / "tickets" / ticket_id
-    if not ticket_path.exists():
+    entries = _list_dir(ticket_path)
+    if entries is None:
         # Check archive
         ticket_path = docs_path / "tickets" / "archive" / ticket_id
-        if not ticket_path.exists():
+        entries = _list_dir(ticket_path)
+        if entries is None:
             result.status = "not_found"
-            result.issues.append(ValidationIssue(
+            result.add_issue(ValidationIssue(
                 severity="error",
                 category="prerequisites",
                 message=f"Ticket {ticket_id} not found",
             ))
             return result
 
+    docs = TicketDocs.load(ticket_path, entries)
+    if use_cache:
+        cache_key = _cache_key(ticket_path, docs, docs_path)
+        cache_file = _cache_file(docs_path, ticket_id)
+        cached = _load_cache(cache_file, cache_key)
+        if cached is not None:
+            return cached
+
     # Check required documents exist
     required_docs = ["1-definition.md", "2-plan.md", "3-spec.md"]
     for doc in required_docs:
-        if (ticket_path / doc).exists():
+        if doc in entries:
             result.checks_passed.append(f"{doc} exists")
         else:
-            result.issues.append(ValidationIssue(
+            result.add_issue(ValidationIssue(
                 severity="error",
                 category="prerequisites",
                 message=f"Required document missing: {doc}",
@@ -521,38 +791,74 @@ def validate_ticket(ticket_id: str, docs_path: Path) -> ValidationResult:
             ))
 
     # Run validation checks
-    check_ambiguity(ticket_path, result)
-    check_prerequisites(ticket_path, result)
-    check_testing_methods(ticket_path, result)
-    check_repo_management(ticket_path, docs_path, result)
+    check_ambiguity(docs, result)
+    check_prerequisites(docs, result)
+    check_testing_methods(docs, result)
+    check_repo_management(docs, docs_path, result)
 
     # Determine overall status
-    errors = [i for i in result.issues if i.severity == "error"]
-    warnings = [i for i in result.issues if i.severity == "warning"]
-
-    if errors:
-        # Check if blocking (missing critical sections)
-        critical_missing = any(
-            "missing" in i.message.lower() and i.category == "prerequisites"
-            for i in errors
-        )
-        result.status = "blocked" if critical_missing else "issues"
-    elif warnings:
+    if result.error_count:
+        # Blocking if critical sections are missing
+        result.status = "blocked" if result.has_blocking_error else "issues"
+    elif result.warning_count:
         result.status = "issues"
     else:
         result.status = "valid"
 
     # Add summary checks
-    result.checks_failed = [i.message for i in errors]
+    result.checks_failed = list(result.error_messages)
+
+    if use_cache:
+        _store_cache(cache_file, cache_key, result)
 
     return result
 
 
+def validate_tickets(ticket_ids: list[str], docs_path: Path, use_cache: bool = False) -> list[ValidationResult]:
+    """Validate several tickets, fanning out to worker processes.
+
+    Results are returned in the order of ticket_ids.
+    """
+    if len(ticket_ids) == 1:
+        return [validate_ticket(ticket_ids[0], docs_path, use_cache=use_cache)]
+    # Deferred: multiprocessing is only worth importing for a batch
+    from concurrent.futures import ProcessPoolExecutor
+
+    worker = partial(validate_ticket, docs_path=docs_path, use_cache=use_cache)
+    with ProcessPoolExecutor() as ex:
+        return list(ex.map(worker, ticket_ids, chunksize=4))
+
+
+def print_text(result: ValidationResult) -> None:
+    """Print a human-readable validation report."""
+    print(f"Ticket: {result.ticket_id}")
+    print(f"Status: {result.status.upper()}")
+    print(f"Roadmap marker: {result.roadmap_marker}")
+    print()
+
+    if result.checks_passed:
+        print("PASSED:")
+        for check in result.checks_passed:
+            print(f"  [+] {check}")
+        print()
+
+    if result.issues:
+        print("ISSUES:")
+        for issue in result.issues:
+            icon = "!" if issue.severity == "error" else "?"
+            loc = f" ({issue.file}:{issue.line})" if issue.line else f" ({issue.file})" if issue.file else ""
+            print(f"  [{icon}] [{issue.category}] {issue.message}{loc}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate planning documents before implementation"
     )
-    parser.add_argument("ticket_id", help="Ticket ID (e.g., T00021)")
+    parser.add_argument(
+        "ticket_id",
+        nargs="+",
+        help="Ticket ID(s) (e.g., T00021); several are validated in parallel",
+    )
     parser.add_argument(
         "--docs-path",
         help="Path to .pmc/docs directory",
@@ -564,6 +870,11 @@ def main():
         default="json",
         help="Output format",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse results for unchanged tickets (.pmc/.cache/plan-validation/)",
+    )
 
     args = parser.parse_args()
 
@@ -573,47 +884,41 @@ def main():
     else:
         docs_path = find_docs_path(Path.cwd())
 
+    batch = len(args.ticket_id) > 1
+
     if not docs_path or not docs_path.exists():
-        print(json.dumps({
-            "ticket_id": args.ticket_id,
-            "status": "not_found",
-            "error": "Could not find .pmc/docs directory",
-        }))
+        errors = [
+            {
+                "ticket_id": ticket_id,
+                "status": "not_found",
+                "error": "Could not find .pmc/docs directory",
+            }
+            for ticket_id in args.ticket_id
+        ]
+        print(json.dumps(errors if batch else errors[0]))
         sys.exit(3)
 
     # Validate
-    result = validate_ticket(args.ticket_id, docs_path)
+    results = validate_tickets(args.ticket_id, docs_path, use_cache=args.cache)
 
     # Output
     if args.format == "json":
-        print(json.dumps(result.to_dict(), indent=2))
+        data = [r.to_dict() for r in results]
+        print(dumps_json(data if batch else data[0]))
     else:
-        print(f"Ticket: {result.ticket_id}")
-        print(f"Status: {result.status.upper()}")
-        print(f"Roadmap marker: {result.roadmap_marker}")
-        print()
-
-        if result.checks_passed:
-            print("PASSED:")
-            for check in result.checks_passed:
-                print(f"  [+] {check}")
-            print()
-
-        if result.issues:
-            print("ISSUES:")
-            for issue in result.issues:
-                icon = "!" if issue.severity == "error" else "?"
-                loc = f" ({issue.file}:{issue.line})" if issue.line else f" ({issue.file})" if issue.file else ""
-                print(f"  [{icon}] [{issue.category}] {issue.message}{loc}")
+        for i, result in enumerate(results):
+            if i:
+                print()
+            print_text(result)
 
-    # Exit code based on status
+    # Exit code based on status (worst across tickets)
     exit_codes = {
         "valid": 0,
         "issues": 1,
         "blocked": 2,
         "not_found": 3,
     }
-    sys.exit(exit_codes.get(result.status, 1))
+    sys.exit(max(exit_codes.get(r.status, 1) for r in results))
 
 
 if __name__ == "__main__":
@@ -6,14 +6,28 @@ Usage:
     python check_integrity.py
     python check_integrity.py --json
     python check_integrity.py --docs-path .pmc/docs
+    python check_integrity.py --fast-fail      # Stop at first issue
+    python check_integrity.py --stream         # Print issues as found
 """
 
 import argparse
 import json
+import os
 import re
 import sys
+from itertools import chain, islice
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
+
+try:
+    import orjson
+except ImportError:  # Optional: faster --json report output
+    orjson = None
+
+# T00001 or I00001 at start of line
+_ITEM_RE = re.compile(r'^([TI]\d+)', re.MULTILINE)
+# Ticket (T00001) or issue (I00001) reference anywhere in text
+_REF_RE = re.compile(r'\b([TI])(\d+)\b')
 
 
 @dataclass
@@ -26,166 +40,229 @@ class IntegrityIssue:
 @dataclass
 class IntegrityStatus:
     valid: bool = True
-    tickets_in_dir: list[str] = field(default_factory=list)
-    tickets_in_index: list[str] = field(default_factory=list)
-    tickets_in_roadmap: list[str] = field(default_factory=list)
-    issues_in_dir: list[str] = field(default_factory=list)
-    issues_in_index: list[str] = field(default_factory=list)
-    issues_in_roadmap: list[str] = field(default_factory=list)
-    archived_tickets: list[str] = field(default_factory=list)
-    archived_issues: list[str] = field(default_factory=list)
+    tickets_in_dir: tuple[str, ...] = ()
+    tickets_in_index: tuple[str, ...] = ()
+    tickets_in_roadmap: tuple[str, ...] = ()
+    issues_in_dir: tuple[str, ...] = ()
+    issues_in_index: tuple[str, ...] = ()
+    issues_in_roadmap: tuple[str, ...] = ()
+    archived_tickets: tuple[str, ...] = ()
+    archived_issues: tuple[str, ...] = ()
     issues: list[IntegrityIssue] = field(default_factory=list)
 
 
-def get_directories(path: Path, prefix: str) -> list[str]:
+def get_directories(path: Path, prefix: str) -> tuple[str, ...]:
     """Get list of directories matching prefix (T or I)."""
-    if not path.exists():
-        return []
-    return sorted([
-        d.name for d in path.iterdir()
-        if d.is_dir() and d.name.startswith(prefix)
-    ])
+    try:
+        with os.scandir(path) as it:
+            # Name check first: is_dir() is answered from the directory entry
+            # type and only stats symlinks, which are followed like iterdir()
+            return tuple(sorted(e.name for e in it if e.name.startswith(prefix) and e.is_dir()))
+    except FileNotFoundError:
+        return ()
 
 
-def parse_index(index_path: Path) -> list[str]:
+def parse_index(index_path: Path) -> tuple[str, ...]:
     """Parse index.md to get list of items."""
-    if not index_path.exists():
-        return []
+    try:
+        content = index_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return ()
 
-    content = index_path.read_text(encoding="utf-8")
     # Match T00001 or I00001 at start of line
-    items = re.findall(r'^([TI]\d+)', content, re.MULTILINE)
-    return sorted(set(items))
+    items = _ITEM_RE.findall(content)
+    return tuple(sorted(set(items)))
 
 
-def parse_roadmap(roadmap_path: Path) -> tuple[list[str], list[str]]:
+def parse_roadmap(roadmap_path: Path) -> tuple[tuple[str, ...], tuple[str, ...]]:
     """Parse roadmap.md to get tickets and issues mentioned."""
-    if not roadmap_path.exists():
-        return [], []
+    try:
+        content = roadmap_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return (), ()
+
+    # Collect ticket and issue references in a single pass
+    tickets, issues = set(), set()
+    for match in _REF_RE.finditer(content):
+        (tickets if match.group(1) == "T" else issues).add(match.group(0))
+
+    return tuple(sorted(tickets)), tuple(sorted(issues))
+
+
+def _diff_checks(
+    in_dir: tuple[str, ...],
+    in_index: tuple[str, ...],
+    in_roadmap: tuple[str, ...],
+    archived: tuple[str, ...],
+    index_name: str,
+):
+    """Yield integrity issues for one kind of item (tickets or issues)."""
+    in_dir, in_index, in_roadmap, archived = map(set, (in_dir, in_index, in_roadmap, archived))
+
+    # Directory exists but not in index
+    for item in sorted(in_dir - in_index):
+        yield IntegrityIssue(
+            type="missing_index",
+            item=item,
+            detail=f"{item} directory exists but not in {index_name}"
+        )
+
+    # In index but directory doesn't exist
+    for item in sorted(in_index - in_dir - archived):
+        yield IntegrityIssue(
+            type="orphan_index",
+            item=item,
+            detail=f"{item} in index.md but directory not found"
+        )
+
+    # Active but not in roadmap
+    for item in sorted(in_dir - in_roadmap):
+        yield IntegrityIssue(
+            type="missing_roadmap",
+            item=item,
+            detail=f"{item} is active but not in roadmap.md"
+        )
+
+    # In roadmap but archived (stale reference)
+    for item in sorted(in_roadmap & archived):
+        yield IntegrityIssue(
+            type="stale_roadmap",
+            item=item,
+            detail=f"{item} in roadmap.md but already archived"
+        )
+
+
+def _load_tickets(status: IntegrityStatus, docs_path: Path) -> None:
+    """Fill the active, archived and indexed ticket lists."""
+    tickets_path = docs_path / "tickets"
+    status.tickets_in_dir = get_directories(tickets_path, "T")
+    status.archived_tickets = get_directories(tickets_path / "archive", "T")
+    status.tickets_in_index = parse_index(tickets_path / "index.md")
 
-    content = roadmap_path.read_text(encoding="utf-8")
 
-    # Find all ticket references (T followed by digits)
-    tickets = re.findall(r'\b(T\d+)\b', content)
-    # Find all issue references (I followed by digits)
-    issues = re.findall(r'\b(I\d+)\b', content)
+def _load_issues(status: IntegrityStatus, docs_path: Path) -> None:
+    """Fill the active, archived and indexed issue lists."""
+    issues_path = docs_path / "issues"
+    status.issues_in_dir = get_directories(issues_path, "I")
+    status.archived_issues = get_directories(issues_path / "archive", "I")
+    status.issues_in_index = parse_index(issues_path / "index.md")
 
-    return sorted(set(tickets)), sorted(set(issues))
 
+def _load_roadmap(status: IntegrityStatus, docs_path: Path) -> None:
+    """Fill the ticket and issue lists referenced by roadmap.md."""
+    roadmap_path = docs_path / "3-plan" / "roadmap.md"
+    status.tickets_in_roadmap, status.issues_in_roadmap = parse_roadmap(roadmap_path)
 
-def check_integrity(docs_path: Path) -> IntegrityStatus:
-    """Check KB integrity."""
-    status = IntegrityStatus()
 
-    # Get active directories
-    tickets_path = docs_path / "tickets"
-    issues_path = docs_path / "issues"
+def _ticket_checks(status: IntegrityStatus):
+    return _diff_checks(
+        status.tickets_in_dir, status.tickets_in_index,
+        status.tickets_in_roadmap, status.archived_tickets, "tickets/index.md",
+    )
 
-    status.tickets_in_dir = get_directories(tickets_path, "T")
-    status.issues_in_dir = get_directories(issues_path, "I")
 
-    # Get archived directories
-    status.archived_tickets = get_directories(tickets_path / "archive", "T")
-    status.archived_issues = get_directories(issues_path / "archive", "I")
+def _issue_checks(status: IntegrityStatus):
+    return _diff_checks(
+        status.issues_in_dir, status.issues_in_index,
+        status.issues_in_roadmap, status.archived_issues, "issues/index.md",
+    )
 
-    # Parse indexes
-    status.tickets_in_index = parse_index(tickets_path / "index.md")
-    status.issues_in_index = parse_index(issues_path / "index.md")
 
-    # Parse roadmap
-    roadmap_path = docs_path / "3-plan" / "roadmap.md"
-    roadmap_tickets, roadmap_issues = parse_roadmap(roadmap_path)
-    status.tickets_in_roadmap = roadmap_tickets
-    status.issues_in_roadmap = roadmap_issues
-
-    # Check tickets: directory exists but not in index
-    for ticket in status.tickets_in_dir:
-        if ticket not in status.tickets_in_index:
-            status.issues.append(IntegrityIssue(
-                type="missing_index",
-                item=ticket,
-                detail=f"{ticket} directory exists but not in tickets/index.md"
-            ))
-            status.valid = False
-
-    # Check tickets: in index but directory doesn't exist
-    for ticket in status.tickets_in_index:
-        if ticket not in status.tickets_in_dir and ticket not in status.archived_tickets:
-            status.issues.append(IntegrityIssue(
-                type="orphan_index",
-                item=ticket,
-                detail=f"{ticket} in index.md but directory not found"
-            ))
-            status.valid = False
-
-    # Check tickets: active but not in roadmap
-    for ticket in status.tickets_in_dir:
-        if ticket not in status.tickets_in_roadmap:
-            status.issues.append(IntegrityIssue(
-                type="missing_roadmap",
-                item=ticket,
-                detail=f"{ticket} is active but not in roadmap.md"
-            ))
-            status.valid = False
-
-    # Check tickets: in roadmap but archived (stale reference)
-    for ticket in status.tickets_in_roadmap:
-        if ticket in status.archived_tickets:
-            status.issues.append(IntegrityIssue(
-                type="stale_roadmap",
-                item=ticket,
-                detail=f"{ticket} in roadmap.md but already archived"
-            ))
-            status.valid = False
-
-    # Same checks for issues
-    for issue in status.issues_in_dir:
-        if issue not in status.issues_in_index:
-            status.issues.append(IntegrityIssue(
-                type="missing_index",
-                item=issue,
-                detail=f"{issue} directory exists but not in issues/index.md"
-            ))
-            status.valid = False
-
-    for issue in status.issues_in_index:
-        if issue not in status.issues_in_dir and issue not in status.archived_issues:
-            status.issues.append(IntegrityIssue(
-                type="orphan_index",
-                item=issue,
-                detail=f"{issue} in index.md but directory not found"
-            ))
-            status.valid = False
-
-    for issue in status.issues_in_dir:
-        if issue not in status.issues_in_roadmap:
-            status.issues.append(IntegrityIssue(
-                type="missing_roadmap",
-                item=issue,
-                detail=f"{issue} is active but not in roadmap.md"
-            ))
-            status.valid = False
-
-    for issue in status.issues_in_roadmap:
-        if issue in status.archived_issues:
-            status.issues.append(IntegrityIssue(
-                type="stale_roadmap",
-                item=issue,
-                detail=f"{issue} in roadmap.md but already archived"
-            ))
-            status.valid = False
+def check_integrity(docs_path: Path, fast_fail: bool = False) -> IntegrityStatus:
+    """Check KB integrity.
+
+    With fast_fail, stop checking at the first issue found. All lists are
+    still loaded, so the summary counts are complete.
+    """
+    status = IntegrityStatus()
+    _load_roadmap(status, docs_path)
+    _load_tickets(status, docs_path)
+    _load_issues(status, docs_path)
+
+    found = _ticket_checks(status)
+    status.issues.extend(islice(found, 1) if fast_fail else found)
+    if fast_fail and status.issues:
+        status.valid = False
+        return status
 
+    found = _issue_checks(status)
+    status.issues.extend(islice(found, 1) if fast_fail else found)
+
+    status.valid = not status.issues
     return status
 
 
-def format_output(status: IntegrityStatus, as_json: bool = False) -> str:
+def stream_integrity(docs_path: Path, fast_fail: bool = False) -> bool:
+    """Print the text report, writing each issue row as soon as it is found.
+
+    Produces the same output as format_output() without holding the issue
+    list or the rendered report in memory. Returns True if the KB is valid.
+    """
+    status = IntegrityStatus()
+    _load_roadmap(status, docs_path)
+    _load_tickets(status, docs_path)
+    _load_issues(status, docs_path)
+
+    write = sys.stdout.write
+    write("\n".join(_summary_lines(status)) + "\n")
+
+    found = chain(_ticket_checks(status), _issue_checks(status))
+    count = 0
+    for issue in islice(found, 1) if fast_fail else found:
+        if not count:
+            write("## Issues Found\n\n| Type | Item | Detail |\n|------|------|--------|\n")
+        write(f"| {issue.type} | {issue.item} | {issue.detail} |\n")
+        count += 1
+    if count:
+        write("\n")
+
+    write("\n".join(_result_lines(count == 0, count)) + "\n")
+    return count == 0
+
+
+def _json_default(obj):
+    """Serialize dataclasses field by field instead of through an asdict() copy."""
+    if hasattr(obj, "__dataclass_fields__"):
+        return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(data, compact: bool = False) -> str:
+    """Serialize data as JSON, indented by two spaces unless compact."""
+    if orjson is not None:
+        # orjson serializes dataclasses natively
+        return orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2).decode()
+    if compact:
+        return json.dumps(data, default=_json_default, separators=(",", ":"))
+    return json.dumps(data, default=_json_default, indent=2)
+
+
+def format_output(status: IntegrityStatus, as_json: bool = False, compact: bool = False) -> str:
     """Format the status output."""
     if as_json:
-        data = asdict(status)
-        # Convert IntegrityIssue objects to dicts
-        data["issues"] = [asdict(i) for i in status.issues]
-        return json.dumps(data, indent=2)
+        return dumps_json(status, compact=compact)
+
+    lines = _summary_lines(status)
+
+    # Issues
+    if status.issues:
+        lines.append("## Issues Found")
+        lines.append("")
+        lines.append("| Type | Item | Detail |")
+        lines.append("|------|------|--------|")
+        lines.extend(
+            f"| {issue.type} | {issue.item} | {issue.detail} |"
+            for issue in status.issues
+        )
+        lines.append("")
+
+    lines.extend(_result_lines(status.valid, len(status.issues)))
+
+    return "\n".join(lines)
+
 
+def _summary_lines(status: IntegrityStatus) -> list[str]:
+    """Title and summary table of the text report."""
     lines = []
     lines.append("# KB Integrity Check")
     lines.append("")
@@ -198,26 +275,19 @@ def format_output(status: IntegrityStatus, as_json: bool = False) -> str:
     lines.append(f"| Tickets | {len(status.tickets_in_dir)} | {len(status.archived_tickets)} | {len(status.tickets_in_index)} | {len(status.tickets_in_roadmap)} |")
     lines.append(f"| Issues | {len(status.issues_in_dir)} | {len(status.archived_issues)} | {len(status.issues_in_index)} | {len(status.issues_in_roadmap)} |")
     lines.append("")
+    return lines
 
-    # Issues
-    if status.issues:
-        lines.append("## Issues Found")
-        lines.append("")
-        lines.append("| Type | Item | Detail |")
-        lines.append("|------|------|--------|")
-        for issue in status.issues:
-            lines.append(f"| {issue.type} | {issue.item} | {issue.detail} |")
-        lines.append("")
 
-    # Result
+def _result_lines(valid: bool, issue_count: int) -> list[str]:
+    """Result section of the text report."""
+    lines = []
     lines.append("## Result")
     lines.append("")
-    if status.valid:
+    if valid:
         lines.append("**VALID** - All integrity checks passed")
     else:
-        lines.append(f"**INVALID** - {len(status.issues)} issues found")
-
-    return "\n".join(lines)
+        lines.append(f"**INVALID** - {issue_count} issues found")
+    return lines
 
 
 def main():
@@ -225,11 +295,26 @@ def main():
         description="Check KB integrity: indexes and roadmap consistency"
     )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="With --json, emit compact JSON without indentation"
+    )
     parser.add_argument(
         "--docs-path",
         default=".pmc/docs",
         help="Path to docs directory (default: .pmc/docs)"
     )
+    parser.add_argument(
+        "--fast-fail",
+        action="store_true",
+        help="Stop at the first issue found (summary counts may be partial)"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print issues as they are found (text output only)"
+    )
 
     args = parser.parse_args()
 
@@ -238,8 +323,12 @@ def main():
         print(f"Error: Docs path not found: {docs_path}", file=sys.stderr)
         sys.exit(1)
 
-    status = check_integrity(docs_path)
-    print(format_output(status, as_json=args.json))
+    if args.stream and not args.json:
+        valid = stream_integrity(docs_path, fast_fail=args.fast_fail)
+        sys.exit(0 if valid else 1)
+
+    status = check_integrity(docs_path, fast_fail=args.fast_fail)
+    print(format_output(status, as_json=args.json, compact=args.compact))
 
     sys.exit(0 if status.valid else 1)
 
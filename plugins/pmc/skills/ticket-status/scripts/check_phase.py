@@ -9,14 +9,54 @@ Usage:
 """
 
 import argparse
+import functools
 import json
+import os
 import re
 import subprocess
 import sys
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass
 from typing import Literal
 
+try:
+    import orjson
+except ImportError:  # Optional: faster --json phase report output
+    orjson = None
+
+# Phases with fewer tickets are checked serially; threads cost more than they save
+_PARALLEL_MIN_TICKETS = 4
+
+_GOAL_RE = re.compile(r'\*\*Goal:\*\*\s*([^\n]+)')
+_TICKET_RE = re.compile(r'\b(T\d+)\b')
+_STATUS_RE = re.compile(r'Status:\s*(COMPLETE|BLOCKED)', re.IGNORECASE)
+# "Status:" with nothing but whitespace after it, continued on the next line
+_STATUS_TAIL_RE = re.compile(r'Status:\s*\Z', re.IGNORECASE)
+# Any numbered phase header line. Only "###" is consumed so headers nested in
+# a previous title or body are still visited, matching a per-phase search().
+_ANY_PHASE_RE = re.compile(
+    r'###(?=\s*((?:[\w-]+[:\s]+)?)Phase\s*(\d+)[:\s-]+([^\n]*)\n)',
+    re.IGNORECASE,
+)
+# Same header without the feature prefix, for "### Phase1 Phase2: ..." lines
+_BARE_PHASE_RE = re.compile(r'###\s*Phase\s*(\d+)[:\s-]+([^\n]*)\n', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
+def _phase_re(phase_id: str) -> re.Pattern:
+    """Compile the phase header pattern for a phase ID.
+
+    Matches:
+    ### Phase N: Description
+    ### Phase N - Description
+    ### feat-name: Phase N - Description
+    ### feat-name Phase N: Description
+    """
+    return re.compile(
+        rf'###\s*(?:[\w-]+[:\s]+)?Phase\s*{phase_id}[:\s-]+([^\n]*)\n',
+        re.IGNORECASE | re.DOTALL,
+    )
+
 
 @dataclass
 class TicketSummary:
@@ -32,7 +72,7 @@ class PhaseStatus:
     phase_id: str
     found: bool = False
     goal: str = ""
-    tickets: list[TicketSummary] = field(default_factory=list)
+    tickets: tuple[TicketSummary, ...] = ()
     total: int = 0
     complete: int = 0
     blocked: int = 0
@@ -51,37 +91,96 @@ def parse_roadmap_phase(roadmap_path: Path, phase_id: str) -> tuple[bool, str, l
     - ### feat-name: Phase N - Description
     - ### feat-name Phase N: Description
     """
-    if not roadmap_path.exists():
+    try:
+        mtime_ns = roadmap_path.stat().st_mtime_ns
+    except FileNotFoundError:
         return False, "", []
 
-    content = roadmap_path.read_text(encoding="utf-8")
+    content, phases = _roadmap_phases(str(roadmap_path), mtime_ns)
 
-    # More flexible pattern that matches:
-    # ### Phase N: Description
-    # ### Phase N - Description
-    # ### feat-name: Phase N - Description
-    # ### feat-name Phase N: Description
-    phase_pattern = rf'###\s*(?:[\w-]+[:\s]+)?Phase\s*{phase_id}[:\s-]+([^\n]*)\n(.*?)(?=\n###|\Z)'
-    match = re.search(phase_pattern, content, re.IGNORECASE | re.DOTALL)
+    if phase_id in phases:
+        goal, tickets = phases[phase_id]
+        return True, goal, list(tickets)
+
+    # Non-numeric phase IDs are not indexed; search for them directly
+    match = _phase_re(phase_id).search(content)
 
     if not match:
         return False, "", []
 
-    phase_title = match.group(1).strip()
-    phase_content = match.group(2)
+    goal, tickets = _summarize_phase(match.group(1), _section_body(content, match.end()))
+    return True, goal, tickets
+
+
+def _section_body(content: str, start: int) -> str:
+    """Return the phase body from start up to the next "###" line."""
+    end = content.find("\n###", start)
+    return content[start:] if end == -1 else content[start:end]
 
+
+def _summarize_phase(phase_title: str, phase_content: str) -> tuple[str, list[str]]:
+    """Extract goal and ticket IDs from a phase section."""
     # Extract goal if present
-    goal_match = re.search(r'\*\*Goal:\*\*\s*([^\n]+)', phase_content)
-    goal = goal_match.group(1).strip() if goal_match else phase_title
+    goal_match = _GOAL_RE.search(phase_content)
+    goal = goal_match.group(1).strip() if goal_match else phase_title.strip()
 
     # Extract ticket IDs
-    tickets = re.findall(r'\b(T\d+)\b', phase_content)
+    tickets = _TICKET_RE.findall(phase_content)
+
+    return goal, list(dict.fromkeys(tickets))  # Remove duplicates, keep order
 
-    return True, goal, list(dict.fromkeys(tickets))  # Remove duplicates, keep order
 
+@functools.lru_cache(maxsize=8)
+def _roadmap_phases(path_str: str, mtime_ns: int) -> tuple[str, dict[str, tuple[str, list[str]]]]:
+    """Read roadmap.md once and index every numbered phase by ID.
 
-def check_ticket_status(ticket_id: str, docs_path: Path) -> TicketSummary:
-    """Check individual ticket status using check_ticket.py logic."""
+    Keyed on mtime so edits to the roadmap invalidate the cache.
+    """
+    content = Path(path_str).read_text(encoding="utf-8")
+    phases = {}
+    for match in _ANY_PHASE_RE.finditer(content):
+        prefix, phase_id, title = match.groups()
+        if phase_id not in phases:  # first occurrence wins, as with search()
+            body = _section_body(content, match.end(3) + 1)
+            phases[phase_id] = _summarize_phase(title, body)
+        if prefix:
+            bare = _BARE_PHASE_RE.match(content, match.start())
+            if bare and bare.group(1) not in phases:
+                body = _section_body(content, bare.end())
+                phases[bare.group(1)] = _summarize_phase(bare.group(2), body)
+    return content, phases
+
+
+def list_dir_names(path: Path) -> set[str] | None:
+    """Return the entry names in a directory, or None if it cannot be listed."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return None
+
+
+def read_final_status(final_path: Path) -> str | None:
+    """Return COMPLETE or BLOCKED from the first "Status:" line, reading lazily."""
+    pending = ""
+    with final_path.open(encoding="utf-8") as f:
+        for line in f:
+            if not pending and ":" not in line:
+                continue
+            text = pending + line
+            status_match = _STATUS_RE.search(text)
+            if status_match:
+                return status_match.group(1).upper()
+            tail = _STATUS_TAIL_RE.search(text)
+            pending = tail.group(0) if tail else ""
+    return None
+
+
+def check_ticket_status(ticket_id: str, docs_path: Path, files: set[str] | None) -> TicketSummary:
+    """Check individual ticket status using check_ticket.py logic.
+
+    ``files`` holds the names in the ticket directory, or None if it is missing.
+    """
     ticket_path = docs_path / "tickets" / ticket_id
 
     summary = TicketSummary(
@@ -92,26 +191,24 @@ def check_ticket_status(ticket_id: str, docs_path: Path) -> TicketSummary:
         next_step="missing"
     )
 
-    if not ticket_path.exists():
+    if files is None:
         return summary
 
     summary.exists = True
 
     # Check 5-final.md
     final_path = ticket_path / "5-final.md"
-    if final_path.exists():
+    if "5-final.md" in files:
         summary.has_final = True
-        content = final_path.read_text(encoding="utf-8")
-        status_match = re.search(r'Status:\s*(COMPLETE|BLOCKED)', content, re.IGNORECASE)
-        if status_match:
-            summary.final_status = status_match.group(1).upper()
+        summary.final_status = read_final_status(final_path)
+        if summary.final_status:
             summary.next_step = "complete" if summary.final_status == "COMPLETE" else "blocked"
         else:
             summary.next_step = "needs-final-status"
     else:
         # Check what's missing
         required_docs = ["1-definition.md", "2-plan.md", "3-spec.md"]
-        missing = [d for d in required_docs if not (ticket_path / d).exists()]
+        missing = [d for d in required_docs if d not in files]
         if missing:
             summary.next_step = "missing-docs"
         else:
@@ -136,11 +233,28 @@ def check_phase(phase_id: str, docs_path: Path) -> PhaseStatus:
     status.goal = goal
     status.total = len(tickets)
 
-    # Check each ticket
-    for ticket_id in tickets:
-        ticket_summary = check_ticket_status(ticket_id, docs_path)
-        status.tickets.append(ticket_summary)
+    # List the tickets directory once, then each phase ticket's directory once
+    tickets_path = docs_path / "tickets"
+    existing = list_dir_names(tickets_path) or set()
+
+    def check(ticket_id: str) -> TicketSummary:
+        files = None
+        if ticket_id in existing:
+            files = list_dir_names(tickets_path / ticket_id) or set()
+        return check_ticket_status(ticket_id, docs_path, files)
 
+    # Ticket checks are independent blocking reads; overlap them on larger phases
+    if len(tickets) < _PARALLEL_MIN_TICKETS:
+        summaries = list(map(check, tickets))
+    else:
+        from concurrent.futures import ThreadPoolExecutor  # Deferred: small phases never need it
+        with ThreadPoolExecutor(max_workers=min(32, len(tickets))) as pool:
+            summaries = list(pool.map(check, tickets))
+
+    status.tickets = tuple(summaries)
+
+    # Check each ticket
+    for ticket_id, ticket_summary in zip(tickets, summaries):
         if ticket_summary.final_status == "COMPLETE":
             status.complete += 1
         elif ticket_summary.final_status == "BLOCKED":
@@ -165,11 +279,27 @@ def check_phase(phase_id: str, docs_path: Path) -> PhaseStatus:
     return status
 
 
-def format_output(status: PhaseStatus, as_json: bool = False) -> str:
+def _json_default(obj):
+    """Serialize dataclasses field by field instead of through an asdict() copy."""
+    if hasattr(obj, "__dataclass_fields__"):
+        return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(data, compact: bool = False) -> str:
+    """Serialize data as JSON, indented by two spaces unless compact."""
+    if orjson is not None:
+        # orjson serializes dataclasses natively
+        return orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2).decode()
+    if compact:
+        return json.dumps(data, default=_json_default, separators=(",", ":"))
+    return json.dumps(data, default=_json_default, indent=2)
+
+
+def format_output(status: PhaseStatus, as_json: bool = False, compact: bool = False) -> str:
     """Format the status output."""
     if as_json:
-        data = asdict(status)
-        return json.dumps(data, indent=2)
+        return dumps_json(status, compact=compact)
 
     lines = []
     lines.append(f"# Phase {status.phase_id} Status")
@@ -206,9 +336,10 @@ def format_output(status: PhaseStatus, as_json: bool = False) -> str:
     lines.append("")
     lines.append("| Ticket | Status | Next Step |")
     lines.append("|--------|--------|-----------|")
-    for t in status.tickets:
-        status_str = t.final_status if t.final_status else "in-progress"
-        lines.append(f"| {t.ticket_id} | {status_str} | {t.next_step} |")
+    lines.extend(
+        f"| {t.ticket_id} | {t.final_status or 'in-progress'} | {t.next_step} |"
+        for t in status.tickets
+    )
     lines.append("")
 
     # Result
@@ -234,6 +365,11 @@ def main():
     )
     parser.add_argument("phase_id", help="Phase number (e.g., 1, 2)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="With --json, emit compact JSON without indentation"
+    )
     parser.add_argument(
         "--docs-path",
         default=".pmc/docs",
@@ -248,7 +384,7 @@ def main():
         sys.exit(1)
 
     status = check_phase(args.phase_id, docs_path)
-    print(format_output(status, as_json=args.json))
+    print(format_output(status, as_json=args.json, compact=args.compact))
 
     # Exit codes: 0=complete, 1=in-progress, 2=blocked, 3=not-found
     if not status.found:
@@ -13,7 +13,31 @@ import json
 import re
 import sys
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
+
+try:
+    import ijson
+except ImportError:  # Optional: stream-parse large tests.json files
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # Optional: faster --json test report output
+    orjson = None
+
+# tests.json files above this size are streamed when ijson is available
+_STREAM_THRESHOLD = 1_000_000
+
+_PARSE_ERRORS = (json.JSONDecodeError, OSError) + ((ijson.JSONError,) if ijson else ())
+
+# Test case forms in 3-spec.md: table row, bullet, or (case-sensitive) header.
+# Each form starts with a different character, so one scan finds all three.
+_SPEC_CASE_RE = re.compile(
+    r'^(?:\|\s*(?P<table>[a-z_][a-z0-9_]*)\s*\|'
+    r'|[-*]\s*(?P<bullet>test_[a-z0-9_]+)'
+    r'|(?-i:#{2,4}\s*(?:Test:\s*)?(?P<header>[A-Za-z][A-Za-z0-9_\s]+)))',
+    re.MULTILINE | re.IGNORECASE,
+)
 
 
 @dataclass
@@ -44,7 +68,7 @@ class TestsCheckStatus:
     spec_exists: bool = False
     total_tests: int = 0
     tests: list[TestDetail] = field(default_factory=list)
-    spec_cases: list[SpecCase] = field(default_factory=list)
+    spec_cases: tuple[SpecCase, ...] = ()
     coverage_pct: float = 0.0
     all_red_verified: bool = False
     all_trajectories_complete: bool = False
@@ -53,33 +77,31 @@ class TestsCheckStatus:
     next_step: str = ""
 
 
-def parse_spec_cases(spec_path: Path) -> list[str]:
-    """Extract test case names from 3-spec.md."""
-    if not spec_path.exists():
-        return []
-
-    content = spec_path.read_text(encoding="utf-8")
-    cases = []
-
-    # Look for test case tables: | test_name | ... |
-    # Or bullet points: - test_name:
-    # Or headers: ### test_name
+def parse_spec_cases(spec_path: Path) -> list[str] | None:
+    """Extract test case names from 3-spec.md, or None if it doesn't exist."""
+    try:
+        content = spec_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
 
     # Table format: | name | input | expected |
-    table_matches = re.findall(r'^\|\s*([a-z_][a-z0-9_]*)\s*\|', content, re.MULTILINE | re.IGNORECASE)
-    cases.extend(table_matches)
-
     # Bullet format: - test_something or * test_something
-    bullet_matches = re.findall(r'^[-*]\s*(test_[a-z0-9_]+)', content, re.MULTILINE | re.IGNORECASE)
-    cases.extend(bullet_matches)
-
     # Header format: ### Test: Something or #### test_something
-    header_matches = re.findall(r'^#{2,4}\s*(?:Test:\s*)?([A-Za-z][A-Za-z0-9_\s]+)', content, re.MULTILINE)
-    # Filter to likely test names
-    for h in header_matches:
-        h_clean = h.strip().lower().replace(' ', '_')
-        if 'test' in h_clean or h_clean.startswith(('unit', 'integration', 'e2e')):
-            cases.append(h_clean)
+    table_cases, bullet_cases, header_cases = [], [], []
+    for m in _SPEC_CASE_RE.finditer(content):
+        table, bullet, header = m.group('table', 'bullet', 'header')
+        if table is not None:
+            table_cases.append(table)
+        elif bullet is not None:
+            bullet_cases.append(bullet)
+        else:
+            # Filter to likely test names
+            h_clean = header.strip().lower().replace(' ', '_')
+            if 'test' in h_clean or h_clean.startswith(('unit', 'integration', 'e2e')):
+                header_cases.append(h_clean)
+
+    # Keep the table, bullet, header precedence for deduplication
+    cases = table_cases + bullet_cases + header_cases
 
     # Deduplicate and filter out table headers/separators
     seen = set()
@@ -99,89 +121,112 @@ def parse_spec_cases(spec_path: Path) -> list[str]:
     return unique
 
 
+def iter_tests(tests_path: Path, size: int):
+    """Yield test entries from tests.json, stream-parsing large files."""
+    if ijson is not None and size > _STREAM_THRESHOLD:
+        with tests_path.open("rb") as f:
+            yield from ijson.items(f, "tests.item")
+        return
+
+    data = json.loads(tests_path.read_text(encoding="utf-8"))
+    yield from data.get("tests", [])
+
+
 def check_tests(ticket_id: str, docs_path: Path) -> TestsCheckStatus:
     """Check test status for a ticket."""
     status = TestsCheckStatus(ticket_id=ticket_id)
 
     # Check 3-spec.md
     spec_path = docs_path / "tickets" / ticket_id / "3-spec.md"
-    if spec_path.exists():
+    spec_cases = parse_spec_cases(spec_path)
+    if spec_cases is not None:
         status.spec_exists = True
-        spec_cases = parse_spec_cases(spec_path)
-        status.spec_cases = [SpecCase(name=c, covered=False) for c in spec_cases]
+        status.spec_cases = tuple(SpecCase(name=c, covered=False) for c in spec_cases)
 
     # Check tests.json
     tests_path = docs_path / "tests" / "tickets" / ticket_id / "tests.json"
-    if not tests_path.exists():
+    try:
+        tests_size = tests_path.stat().st_size
+    except FileNotFoundError:
         status.issues.append("tests.json not found")
         status.next_step = "Create tests.json from 3-spec.md"
         return status
 
     status.tests_json_exists = True
 
+    all_red = True
+    all_trajectory = True
+
     try:
-        data = json.loads(tests_path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError) as e:
+        for t in iter_tests(tests_path, tests_size):
+            get = t.get
+            trajectory = get("trajectory", [])
+            test_status = get("status", "pending")
+            red_verified = bool(get("red_verified"))
+            has_trajectory = len(trajectory) > 0
+
+            detail = TestDetail(
+                id=get("id", ""),
+                name=get("name", ""),
+                status=test_status,
+                required=get("required", False),
+                red_verified=red_verified,
+                has_trajectory=has_trajectory,
+                trajectory_count=len(trajectory),
+                # Entries may be dicts; their str() form is searched as well
+                has_red_marker=any("[RED]" in str(x) for x in trajectory),
+                has_green_marker=any("[GREEN]" in str(x) for x in trajectory),
+            )
+
+            # Check for issues
+            if test_status == "passed":
+                if not has_trajectory:
+                    detail.issues.append("Passed but no trajectory recorded")
+                    status.issues.append(f"{detail.id}: passed without trajectory")
+                    all_trajectory = False
+                if not red_verified:
+                    detail.issues.append("Passed but RED phase not verified")
+                    status.issues.append(f"{detail.id}: missing red_verified")
+                if not detail.has_red_marker and has_trajectory:
+                    detail.issues.append("Trajectory missing [RED] marker")
+                if not detail.has_green_marker and has_trajectory:
+                    detail.issues.append("Trajectory missing [GREEN] marker")
+
+            if not red_verified:
+                all_red = False
+
+            status.tests.append(detail)
+    except _PARSE_ERRORS as e:
+        # A streamed file can fail part way through; report it like a bad load
+        status.tests.clear()
+        status.issues.clear()
         status.issues.append(f"Failed to parse tests.json: {e}")
         status.next_step = "Fix tests.json syntax"
         return status
 
-    tests = data.get("tests", [])
-    status.total_tests = len(tests)
+    status.total_tests = len(status.tests)
 
     if status.total_tests == 0:
         status.issues.append("tests.json has no tests defined")
         status.next_step = "Add test definitions to tests.json"
         return status
 
-    all_red = True
-    all_trajectory = True
-
-    for t in tests:
-        trajectory = t.get("trajectory", [])
-        trajectory_str = " ".join(str(x) for x in trajectory)
-
-        detail = TestDetail(
-            id=t.get("id", ""),
-            name=t.get("name", ""),
-            status=t.get("status", "pending"),
-            required=t.get("required", False),
-            red_verified=bool(t.get("red_verified")),
-            has_trajectory=len(trajectory) > 0,
-            trajectory_count=len(trajectory),
-            has_red_marker="[RED]" in trajectory_str,
-            has_green_marker="[GREEN]" in trajectory_str,
-        )
-
-        # Check for issues
-        if detail.status == "passed":
-            if not detail.has_trajectory:
-                detail.issues.append("Passed but no trajectory recorded")
-                status.issues.append(f"{detail.id}: passed without trajectory")
-            if not detail.red_verified:
-                detail.issues.append("Passed but RED phase not verified")
-                status.issues.append(f"{detail.id}: missing red_verified")
-            if not detail.has_red_marker and detail.has_trajectory:
-                detail.issues.append("Trajectory missing [RED] marker")
-            if not detail.has_green_marker and detail.has_trajectory:
-                detail.issues.append("Trajectory missing [GREEN] marker")
-
-        if not detail.red_verified:
-            all_red = False
-
-        if detail.status == "passed" and not detail.has_trajectory:
-            all_trajectory = False
-
-        status.tests.append(detail)
-
-        # Check coverage against spec cases
+    # Check coverage against spec cases. The last matching test wins, so scan
+    # tests newest-first and stop checking a case once it is covered.
+    uncovered = [(sc, sc.name.lower()) for sc in status.spec_cases]
+    for detail in reversed(status.tests):
+        if not uncovered:
+            break
         test_name_lower = detail.name.lower().replace(' ', '_')
         test_id_lower = detail.id.lower()
-        for sc in status.spec_cases:
-            sc_lower = sc.name.lower()
+        remaining = []
+        for sc, sc_lower in uncovered:
             if sc_lower in test_name_lower or sc_lower in test_id_lower or test_name_lower in sc_lower:
                 sc.covered = True
                 sc.test_id = detail.id
+            else:
+                remaining.append((sc, sc_lower))
+        uncovered = remaining
 
     status.all_red_verified = all_red
     status.all_trajectories_complete = all_trajectory
@@ -222,11 +267,27 @@ def check_tests(ticket_id: str, docs_path: Path) -> TestsCheckStatus:
     return status
 
 
-def format_output(status: TestsCheckStatus, as_json: bool = False) -> str:
+def _json_default(obj):
+    """Serialize dataclasses field by field instead of through an asdict() copy."""
+    if hasattr(obj, "__dataclass_fields__"):
+        return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(data, compact: bool = False) -> str:
+    """Serialize data as JSON, indented by two spaces unless compact."""
+    if orjson is not None:
+        # orjson serializes dataclasses natively
+        return orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2).decode()
+    if compact:
+        return json.dumps(data, default=_json_default, separators=(",", ":"))
+    return json.dumps(data, default=_json_default, indent=2)
+
+
+def format_output(status: TestsCheckStatus, as_json: bool = False, compact: bool = False) -> str:
     """Format the status output."""
     if as_json:
-        data = asdict(status)
-        return json.dumps(data, indent=2)
+        return dumps_json(status, compact=compact)
 
     lines = []
     lines.append(f"# Test Status: {status.ticket_id}")
@@ -261,11 +322,11 @@ def format_output(status: TestsCheckStatus, as_json: bool = False) -> str:
     lines.append("")
     lines.append("| ID | Name | Status | RED | Trajectory | Issues |")
     lines.append("|----|------|--------|-----|------------|--------|")
-    for t in status.tests:
-        red = "+" if t.red_verified else "x"
-        traj = f"{t.trajectory_count}" if t.has_trajectory else "none"
-        issues = "; ".join(t.issues) if t.issues else "-"
-        lines.append(f"| {t.id} | {t.name[:30]} | {t.status} | {red} | {traj} | {issues} |")
+    lines.extend(
+        f"| {t.id} | {t.name[:30]} | {t.status} | {'+' if t.red_verified else 'x'} | "
+        f"{t.trajectory_count if t.has_trajectory else 'none'} | {'; '.join(t.issues) if t.issues else '-'} |"
+        for t in status.tests
+    )
     lines.append("")
 
     # Coverage
@@ -276,10 +337,10 @@ def format_output(status: TestsCheckStatus, as_json: bool = False) -> str:
         lines.append("")
         lines.append("| Spec Case | Covered | Test |")
         lines.append("|-----------|---------|------|")
-        for sc in status.spec_cases:
-            covered = "+" if sc.covered else "x"
-            test = sc.test_id or "-"
-            lines.append(f"| {sc.name} | {covered} | {test} |")
+        lines.extend(
+            f"| {sc.name} | {'+' if sc.covered else 'x'} | {sc.test_id or '-'} |"
+            for sc in status.spec_cases
+        )
         lines.append("")
 
     # Issues
@@ -304,6 +365,11 @@ def main():
     )
     parser.add_argument("ticket_id", help="Ticket ID (e.g., T00001)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="With --json, emit compact JSON without indentation"
+    )
     parser.add_argument(
         "--docs-path",
         default=".pmc/docs",
@@ -318,7 +384,7 @@ def main():
         sys.exit(1)
 
     status = check_tests(args.ticket_id, docs_path)
-    print(format_output(status, as_json=args.json))
+    print(format_output(status, as_json=args.json, compact=args.compact))
 
     # Exit codes: 0=valid, 1=issues
     sys.exit(0 if status.valid and not status.issues else 1)
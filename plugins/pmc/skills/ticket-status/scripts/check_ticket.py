@@ -6,16 +6,26 @@ Usage:
     python check_ticket.py T00001
     python check_ticket.py T00001 --json
     python check_ticket.py T00001 --docs-path .pmc/docs
+    python check_ticket.py T00001 --cache
+    python check_ticket.py --all
 """
 
 import argparse
+import codecs
+import hashlib
 import json
+import os
 import re
 import sys
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Literal
 
+try:
+    import orjson
+except ImportError:  # Optional: faster tests.json parsing, cache files and --json output
+    orjson = None
+
 # Required documents for a ticket
 REQUIRED_DOCS = [
     "1-definition.md",
@@ -25,6 +35,24 @@ REQUIRED_DOCS = [
 
 PROGRESS_DOC = "4-progress.md"
 FINAL_DOC = "5-final.md"
+# Every tracked document, in report order
+_ALL_DOCS = (*REQUIRED_DOCS, PROGRESS_DOC, FINAL_DOC)
+
+# Bytes read from the head of a large document before falling back to a full read
+_HEAD_BYTES = 4096
+# Characters inspected at each end of a document when measuring its stripped length
+_EDGE_CHARS = 256
+
+# --all checks fewer tickets than this one after another, without a thread pool
+_PARALLEL_MIN_TICKETS = 4
+
+# Hashed into every --cache key; bump when status or next-step rules change
+_CACHE_VERSION = 2
+
+_FINAL_STATUS_RE = re.compile(r'Status:\s*(COMPLETE|BLOCKED)', re.IGNORECASE)
+# Constraints header only; the section body is sliced up to the next "##"
+_CONSTRAINTS_RE = re.compile(r'##\s*Constraints\s*\n', re.IGNORECASE)
+_TDD_NO_RE = re.compile(r'TDD:\s*no', re.IGNORECASE)
 
 # Possible next steps
 NextStep = Literal[
@@ -41,13 +69,16 @@ NextStep = Literal[
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class DocStatus:
     exists: bool = False
     has_content: bool = False
 
+    def to_dict(self) -> dict:
+        return {"exists": self.exists, "has_content": self.has_content}
 
-@dataclass
+
+@dataclass(slots=True)
 class TestInfo:
     id: str
     name: str
@@ -56,8 +87,18 @@ class TestInfo:
     red_verified: bool
     has_trajectory: bool
 
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "required": self.required,
+            "red_verified": self.red_verified,
+            "has_trajectory": self.has_trajectory,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class TestsStatus:
     exists: bool = False
     total: int = 0
@@ -69,9 +110,39 @@ class TestsStatus:
     required_total: int = 0
     all_red_verified: bool = False
     tests: list[TestInfo] = field(default_factory=list)
-
-
-@dataclass
+    # Test IDs collected for determine_next_step; only kept in --cache files
+    blocked_ids: list[str] = field(default_factory=list)
+    failed_ids: list[str] = field(default_factory=list)
+    pending_ids: list[str] = field(default_factory=list)
+    unverified_ids: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TestsStatus":
+        """Rebuild a status from its to_dict(with_ids=True) form."""
+        return cls(**{**data, "tests": [TestInfo(**t) for t in data["tests"]]})
+
+    def to_dict(self, with_ids: bool = False) -> dict:
+        data = {
+            "exists": self.exists,
+            "total": self.total,
+            "passed": self.passed,
+            "failed": self.failed,
+            "blocked": self.blocked,
+            "pending": self.pending,
+            "required_passed": self.required_passed,
+            "required_total": self.required_total,
+            "all_red_verified": self.all_red_verified,
+            "tests": [t.to_dict() for t in self.tests],
+        }
+        if with_ids:
+            data["blocked_ids"] = self.blocked_ids
+            data["failed_ids"] = self.failed_ids
+            data["pending_ids"] = self.pending_ids
+            data["unverified_ids"] = self.unverified_ids
+        return data
+
+
+@dataclass(slots=True)
 class TicketStatus:
     ticket_id: str
     exists: bool = False
@@ -82,112 +153,215 @@ class TicketStatus:
     next_step_detail: str = ""
     tdd_enabled: bool = True
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "TicketStatus":
+        """Rebuild a status from its to_dict(with_ids=True) form."""
+        return cls(**{
+            **data,
+            "docs": {name: DocStatus(**d) for name, d in data["docs"].items()},
+            "tests": TestsStatus.from_dict(data["tests"]),
+        })
+
+    def to_dict(self, with_ids: bool = False) -> dict:
+        return {
+            "ticket_id": self.ticket_id,
+            "exists": self.exists,
+            "docs": {name: doc.to_dict() for name, doc in self.docs.items()},
+            "final_status": self.final_status,
+            "tests": self.tests.to_dict(with_ids),
+            "next_step": self.next_step,
+            "next_step_detail": self.next_step_detail,
+            "tdd_enabled": self.tdd_enabled,
+        }
+
+
+def list_ticket_entries(ticket_path: str) -> dict[str, os.DirEntry] | None:
+    """List a ticket directory once, or return None if it doesn't exist."""
+    # scandir doubles as the existence check: a missing ticket costs one failed
+    # open, where an os.path.isdir() probe would add a stat to every found one.
+    # A plain file still counts as an (empty) ticket, as Path.exists() did.
+    try:
+        with os.scandir(ticket_path) as it:
+            return {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        return None
+    except NotADirectoryError:
+        return {}
 
-def check_doc(ticket_path: Path, doc_name: str) -> DocStatus:
-    """Check if a document exists and has content."""
-    doc_path = ticket_path / doc_name
-    if not doc_path.exists():
-        return DocStatus(exists=False, has_content=False)
 
-    content = doc_path.read_text(encoding="utf-8").strip()
-    # Consider content meaningful if > 50 chars (not just template)
-    has_content = len(content) > 50
-    return DocStatus(exists=True, has_content=has_content)
+def _read_entry(entry: os.DirEntry | None) -> str | None:
+    """Read a listed file, or return None if absent (or a dangling symlink)."""
+    if entry is None:
+        return None
+    try:
+        with open(entry.path, encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
 
 
-def parse_final_status(ticket_path: Path) -> str | None:
-    """Parse 5-final.md for Status: COMPLETE or BLOCKED."""
-    final_path = ticket_path / FINAL_DOC
-    if not final_path.exists():
-        return None
+def check_doc(entries: dict[str, os.DirEntry], doc_name: str) -> DocStatus:
+    """Check if a document exists and has content."""
+    entry = entries.get(doc_name)
+    if entry is None:
+        return DocStatus(exists=False, has_content=False)
 
-    content = final_path.read_text(encoding="utf-8")
+    try:
+        size = entry.stat().st_size
+    except FileNotFoundError:  # dangling symlink
+        return DocStatus(exists=False, has_content=False)
+
+    # At most 50 bytes can't decode to more than 50 characters
+    if size <= 50:
+        return DocStatus(exists=True, has_content=False)
+
+    if size > _HEAD_BYTES:
+        # A non-space character 50+ characters after the first one is enough
+        with open(entry.path, "rb") as f:
+            head = codecs.getincrementaldecoder("utf-8")().decode(f.read(_HEAD_BYTES))
+        head = head.replace("\r\n", "\n").replace("\r", "\n").lstrip()
+        if head[50:].strip():
+            return DocStatus(exists=True, has_content=True)
+
+    with open(entry.path, encoding="utf-8") as f:
+        content = f.read()
+    return DocStatus(exists=True, has_content=has_content(content))
+
+
+def has_content(content: str) -> bool:
+    """Consider content meaningful if > 50 chars (not just template)."""
+    if len(content) <= 2 * _EDGE_CHARS:
+        return len(content.strip()) > 50
+    # Measure the edge whitespace without copying the whole document
+    head = content[:_EDGE_CHARS]
+    tail = content[-_EDGE_CHARS:]
+    lead = len(head) - len(head.lstrip())
+    trail = len(tail) - len(tail.rstrip())
+    if lead == _EDGE_CHARS or trail == _EDGE_CHARS:  # whitespace run past the window
+        return len(content.strip()) > 50
+    return len(content) - lead - trail > 50
+
+
+def read_final(entries: dict[str, os.DirEntry]) -> tuple[DocStatus, str | None]:
+    """Read 5-final.md once for its doc status and final status."""
+    content = _read_entry(entries.get(FINAL_DOC))
+    if content is None:
+        return DocStatus(exists=False, has_content=False), None
+
+    doc_status = DocStatus(exists=True, has_content=has_content(content))
+    return doc_status, parse_final_status(content)
+
+
+def parse_final_status(content: str) -> str | None:
+    """Parse 5-final.md content for Status: COMPLETE or BLOCKED."""
     # Look for Status: COMPLETE or Status: BLOCKED
-    match = re.search(r'Status:\s*(COMPLETE|BLOCKED)', content, re.IGNORECASE)
+    match = _FINAL_STATUS_RE.search(content)
     if match:
         return match.group(1).upper()
     return None
 
 
-def check_tdd_enabled(ticket_path: Path) -> bool:
-    """Check if TDD is enabled for this ticket (default: yes).
+def read_definition(entries: dict[str, os.DirEntry]) -> tuple[DocStatus, bool]:
+    """Read 1-definition.md once for its doc status and TDD setting."""
+    content = _read_entry(entries.get("1-definition.md"))
+    if content is None:
+        return DocStatus(exists=False, has_content=False), True  # Default to TDD enabled
+
+    doc_status = DocStatus(exists=True, has_content=has_content(content))
+    return doc_status, check_tdd_enabled(content)
+
+
+def check_tdd_enabled(content: str) -> bool:
+    """Check if TDD is enabled in 1-definition.md content (default: yes).
 
     TDD opt-out must be under ## Constraints section:
         ## Constraints
         - TDD: no (trivial: reason)
     """
-    def_path = ticket_path / "1-definition.md"
-    if not def_path.exists():
-        return True  # Default to TDD enabled
-
-    content = def_path.read_text(encoding="utf-8")
-
     # Find Constraints section
-    constraints_match = re.search(
-        r'##\s*Constraints\s*\n(.*?)(?=\n##|\Z)',
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
+    constraints_match = _CONSTRAINTS_RE.search(content)
 
     if not constraints_match:
         return True  # No Constraints section, default to TDD enabled
 
-    constraints_section = constraints_match.group(1)
+    start = constraints_match.end()
+    end = content.find("\n##", start)
+    constraints_section = content[start:] if end == -1 else content[start:end]
     # Look for TDD: no within Constraints section only
-    if re.search(r'TDD:\s*no', constraints_section, re.IGNORECASE):
+    if _TDD_NO_RE.search(constraints_section):
         return False
     return True
 
 
+def load_json(raw: bytes):
+    """Parse UTF-8 JSON bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
 def check_tests(docs_path: Path, ticket_id: str) -> TestsStatus:
     """Check tests.json for test status."""
-    tests_path = docs_path / "tests" / "tickets" / ticket_id / "tests.json"
+    tests_path = os.path.join(docs_path, "tests", "tickets", ticket_id, "tests.json")
 
     status = TestsStatus()
-    if not tests_path.exists():
+    if not os.path.exists(tests_path):
         return status
 
     try:
-        data = json.loads(tests_path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
+        # Unbuffered: FileIO.readall() sizes one read from fstat, no buffer layer
+        with open(tests_path, "rb", buffering=0) as f:
+            data = load_json(f.read())
+    except (json.JSONDecodeError, OSError):  # orjson's error subclasses JSONDecodeError
         return status
 
     status.exists = True
     tests = data.get("tests", [])
     status.total = len(tests)
 
+    counts = {"passed": 0, "failed": 0, "blocked": 0, "pending": 0}
+    # Only exact statuses are listed; "running" counts as pending but isn't named
+    ids_by_status = {
+        "failed": status.failed_ids,
+        "blocked": status.blocked_ids,
+        "pending": status.pending_ids,
+    }
     all_red_verified = True
     for t in tests:
-        test_info = TestInfo(
-            id=t.get("id", ""),
-            name=t.get("name", ""),
-            status=t.get("status", "pending"),
-            required=t.get("required", False),
-            red_verified=bool(t.get("red_verified")),
-            has_trajectory=bool(t.get("trajectory", [])),
-        )
-        status.tests.append(test_info)
-
-        test_status = t.get("status", "pending")
-        required = t.get("required", False)
-
-        if test_status == "passed":
-            status.passed += 1
-            if required:
-                status.required_passed += 1
-        elif test_status == "failed":
-            status.failed += 1
-        elif test_status == "blocked":
-            status.blocked += 1
-        else:  # pending, running
-            status.pending += 1
+        get = t.get
+        test_id = get("id", "")
+        test_status = get("status", "pending")
+        required = get("required", False)
+        red_verified = bool(get("red_verified"))
+
+        status.tests.append(TestInfo(
+            id=test_id,
+            name=get("name", ""),
+            status=test_status,
+            required=required,
+            red_verified=red_verified,
+            has_trajectory=bool(get("trajectory")),
+        ))
+
+        # Anything other than passed/failed/blocked (pending, running) is pending
+        counts[test_status if test_status in counts else "pending"] += 1
+        ids = ids_by_status.get(test_status)
+        if ids is not None:
+            ids.append(test_id)
+        if not red_verified:
+            status.unverified_ids.append(test_id)
 
         if required:
             status.required_total += 1
+            if test_status == "passed":
+                status.required_passed += 1
 
-        if not t.get("red_verified"):
-            all_red_verified = False
+        all_red_verified &= red_verified
 
+    status.passed = counts["passed"]
+    status.failed = counts["failed"]
+    status.blocked = counts["blocked"]
+    status.pending = counts["pending"]
     status.all_red_verified = all_red_verified and status.total > 0
     return status
 
@@ -231,23 +405,19 @@ def determine_next_step(status: TicketStatus) -> tuple[str, str]:
 
         # Check if any tests are blocked
         if status.tests.blocked > 0:
-            blocked_tests = [t.id for t in status.tests.tests if t.status == "blocked"]
-            return "tests-blocked", f"Blocked tests: {', '.join(blocked_tests)}"
+            return "tests-blocked", f"Blocked tests: {', '.join(status.tests.blocked_ids)}"
 
         # Check RED phase (tests need red_verified before implementation)
         if not status.tests.all_red_verified:
-            unverified = [t.id for t in status.tests.tests if not t.red_verified]
-            return "red-phase", f"Run RED phase for: {', '.join(unverified)}"
+            return "red-phase", f"Run RED phase for: {', '.join(status.tests.unverified_ids)}"
 
         # Check if tests are failing
         if status.tests.failed > 0:
-            failed_tests = [t.id for t in status.tests.tests if t.status == "failed"]
-            return "tests-failing", f"Failing tests: {', '.join(failed_tests)}"
+            return "tests-failing", f"Failing tests: {', '.join(status.tests.failed_ids)}"
 
         # Check if tests are pending (need implementation)
         if status.tests.pending > 0:
-            pending_tests = [t.id for t in status.tests.tests if t.status == "pending"]
-            return "needs-impl", f"Implement to pass: {', '.join(pending_tests)}"
+            return "needs-impl", f"Implement to pass: {', '.join(status.tests.pending_ids)}"
 
         # All tests pass, check if required tests pass
         if status.tests.required_passed < status.tests.required_total:
@@ -268,27 +438,93 @@ def determine_next_step(status: TicketStatus) -> tuple[str, str]:
     return "complete", "All requirements met"
 
 
-def check_ticket(ticket_id: str, docs_path: Path) -> TicketStatus:
-    """Check complete ticket status."""
+def _stat_key(target: os.DirEntry | str) -> bytes:
+    try:
+        # DirEntry caches its stat for check_doc on a cache miss
+        st = target.stat() if isinstance(target, os.DirEntry) else os.stat(target)
+    except OSError:
+        return b"\1"
+    return f"{st.st_mtime_ns}:{st.st_size}\0".encode("utf-8")
+
+
+def _cache_key(ticket_path: str, entries: dict[str, os.DirEntry], tests_path: str) -> str:
+    """Fingerprint the ticket documents and tests.json by mtime and size."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{_CACHE_VERSION}\0{ticket_path}\0".encode("utf-8"))
+    for doc in _ALL_DOCS:
+        entry = entries.get(doc)
+        h.update(b"\1" if entry is None else _stat_key(entry))
+    h.update(_stat_key(tests_path))
+    return h.hexdigest()
+
+
+def _cache_file(docs_path: Path, ticket_id: str) -> Path:
+    return docs_path.parent / ".cache" / "check_ticket" / f"{ticket_id}.json"
+
+
+def _load_cache(cache_file: Path, key: str) -> TicketStatus | None:
+    try:
+        cached = load_json(cache_file.read_bytes())
+        if cached.get("key") == key:
+            return TicketStatus.from_dict(cached["status"])
+    except (OSError, ValueError, AttributeError, KeyError, TypeError):
+        pass  # Missing or unreadable cache entries are recomputed
+    return None
+
+
+def _store_cache(cache_file: Path, key: str, status: TicketStatus) -> None:
+    data = {"key": key, "status": status.to_dict(with_ids=True)}
+    # Renamed into place so a parallel --cache run never loads a half-written status
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            tmp_file.write_bytes(orjson.dumps(data))
+        else:
+            tmp_file.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # A failed store only means recomputing next time
+
+
+def check_ticket(ticket_id: str, docs_path: Path, use_cache: bool = False) -> TicketStatus:
+    """Check complete ticket status.
+
+    With use_cache, results are stored in .pmc/.cache/check_ticket/{ticket_id}.json
+    and reused while the ticket's documents and tests.json are unchanged
+    (by mtime and size).
+    """
     status = TicketStatus(ticket_id=ticket_id)
 
-    ticket_path = docs_path / "tickets" / ticket_id
-    if not ticket_path.exists():
+    ticket_path = os.path.join(docs_path, "tickets", ticket_id)
+    entries = list_ticket_entries(ticket_path)
+    if entries is None:
         status.next_step, status.next_step_detail = determine_next_step(status)
         return status
 
+    if use_cache:
+        tests_path = os.path.join(docs_path, "tests", "tickets", ticket_id, "tests.json")
+        cache_key = _cache_key(ticket_path, entries, tests_path)
+        cache_file = _cache_file(docs_path, ticket_id)
+        cached = _load_cache(cache_file, cache_key)
+        if cached is not None:
+            return cached
+
     status.exists = True
 
-    # Check TDD setting
-    status.tdd_enabled = check_tdd_enabled(ticket_path)
+    # Check TDD setting (from the same read as the definition doc status)
+    definition, status.tdd_enabled = read_definition(entries)
+    status.docs["1-definition.md"] = definition
 
-    # Check all documents
-    all_docs = REQUIRED_DOCS + [PROGRESS_DOC, FINAL_DOC]
-    for doc in all_docs:
-        status.docs[doc] = check_doc(ticket_path, doc)
+    # Parse final status (from the same read as the final doc status)
+    final, status.final_status = read_final(entries)
 
-    # Parse final status
-    status.final_status = parse_final_status(ticket_path)
+    # Check all other documents
+    for doc in _ALL_DOCS:
+        if doc == FINAL_DOC:
+            status.docs[doc] = final
+        elif doc not in status.docs:
+            status.docs[doc] = check_doc(entries, doc)
 
     # Check tests
     status.tests = check_tests(docs_path, ticket_id)
@@ -296,15 +532,50 @@ def check_ticket(ticket_id: str, docs_path: Path) -> TicketStatus:
     # Determine next step
     status.next_step, status.next_step_detail = determine_next_step(status)
 
+    if use_cache:
+        _store_cache(cache_file, cache_key, status)
+
     return status
 
 
-def format_output(status: TicketStatus, as_json: bool = False) -> str:
+def list_ticket_ids(docs_path: Path) -> list[str]:
+    """List active ticket IDs (directories under tickets/, archive excluded)."""
+    try:
+        with os.scandir(os.path.join(docs_path, "tickets")) as it:
+            return sorted(e.name for e in it if e.name.startswith("T") and e.is_dir())
+    except FileNotFoundError:
+        return []
+
+
+def check_all_tickets(docs_path: Path, use_cache: bool = False) -> list[TicketStatus]:
+    """Check every active ticket, in ticket ID order."""
+    tickets = list_ticket_ids(docs_path)
+
+    def check(ticket_id: str) -> TicketStatus:
+        return check_ticket(ticket_id, docs_path, use_cache=use_cache)
+
+    # Each ticket is a handful of stats and small reads; threads overlap the I/O waits
+    if len(tickets) < _PARALLEL_MIN_TICKETS:
+        return list(map(check, tickets))
+
+    from concurrent.futures import ThreadPoolExecutor  # Deferred: only --all needs it
+    with ThreadPoolExecutor(max_workers=min(32, len(tickets))) as pool:
+        return list(pool.map(check, tickets))
+
+
+def dumps_json(data, compact: bool = False) -> str:
+    """Serialize to_dict() output as JSON, indented by two spaces unless compact."""
+    if orjson is not None:
+        return orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2).decode()
+    if compact:
+        return json.dumps(data, separators=(",", ":"))
+    return json.dumps(data, indent=2)
+
+
+def format_output(status: TicketStatus, as_json: bool = False, compact: bool = False) -> str:
     """Format the status output."""
     if as_json:
-        # Convert to dict, handling dataclasses
-        data = asdict(status)
-        return json.dumps(data, indent=2)
+        return dumps_json(status.to_dict(), compact=compact)
 
     lines = []
     lines.append(f"# Ticket Status: {status.ticket_id}")
@@ -320,11 +591,13 @@ def format_output(status: TicketStatus, as_json: bool = False) -> str:
     lines.append("")
     lines.append("| Document | Exists | Content |")
     lines.append("|----------|--------|---------|")
-    for doc in REQUIRED_DOCS + [PROGRESS_DOC, FINAL_DOC]:
-        doc_status = status.docs.get(doc, DocStatus())
-        exists = "OK" if doc_status.exists else "MISSING"
-        content = "OK" if doc_status.has_content else ("empty" if doc_status.exists else "-")
-        lines.append(f"| {doc} | {exists} | {content} |")
+    missing = DocStatus()
+    docs = [(doc, status.docs.get(doc, missing)) for doc in _ALL_DOCS]
+    lines.extend(
+        f"| {doc} | {'OK' if d.exists else 'MISSING'} | "
+        f"{'OK' if d.has_content else ('empty' if d.exists else '-')} |"
+        for doc, d in docs
+    )
     lines.append("")
 
     # TDD Status
@@ -348,10 +621,10 @@ def format_output(status: TicketStatus, as_json: bool = False) -> str:
             if status.tests.tests:
                 lines.append("| Test | Status | Required | RED |")
                 lines.append("|------|--------|----------|-----|")
-                for t in status.tests.tests:
-                    red = "OK" if t.red_verified else "-"
-                    req = "yes" if t.required else "no"
-                    lines.append(f"| {t.id} | {t.status} | {req} | {red} |")
+                lines.extend(
+                    f"| {t.id} | {t.status} | {'yes' if t.required else 'no'} | {'OK' if t.red_verified else '-'} |"
+                    for t in status.tests.tests
+                )
                 lines.append("")
         else:
             lines.append("No tests.json found")
@@ -391,31 +664,51 @@ def main():
     parser = argparse.ArgumentParser(
         description="Check ticket completion status based on KB rules"
     )
-    parser.add_argument("ticket_id", help="Ticket ID (e.g., T00001)")
+    parser.add_argument("ticket_id", nargs="?", help="Ticket ID (e.g., T00001)")
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Check every active ticket (JSON output is a list)",
+    )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="With --json, emit compact JSON without indentation"
+    )
     parser.add_argument(
         "--docs-path",
         default=".pmc/docs",
         help="Path to docs directory (default: .pmc/docs)"
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse the result while the ticket is unchanged (.pmc/.cache/check_ticket/)",
+    )
 
     args = parser.parse_args()
+    if (args.ticket_id is None) == (not args.all):
+        parser.error("give either a ticket ID or --all")
 
     docs_path = Path(args.docs_path)
     if not docs_path.exists():
         print(f"Error: Docs path not found: {docs_path}", file=sys.stderr)
         sys.exit(1)
 
-    status = check_ticket(args.ticket_id, docs_path)
-    print(format_output(status, as_json=args.json))
-
-    # Exit code based on status
-    if status.next_step == "complete":
-        sys.exit(0)
-    elif status.next_step == "blocked":
-        sys.exit(2)
+    if args.all:
+        statuses = check_all_tickets(docs_path, use_cache=args.cache)
+        if args.json:
+            print(dumps_json([s.to_dict() for s in statuses], compact=args.compact))
+        else:
+            print("\n\n".join(format_output(s) for s in statuses))
     else:
-        sys.exit(1)
+        statuses = [check_ticket(args.ticket_id, docs_path, use_cache=args.cache)]
+        print(format_output(statuses[0], as_json=args.json, compact=args.compact))
+
+    # Exit with the worst ticket: blocked (2), then in progress (1), then complete (0)
+    exit_codes = {"complete": 0, "blocked": 2}
+    sys.exit(max((exit_codes.get(s.next_step, 1) for s in statuses), default=0))
 
 
 if __name__ == "__main__":